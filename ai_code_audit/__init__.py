@@ -10,6 +10,8 @@ __version__ = "0.1.0"
 __author__ = "AI Code Audit Team"
 __email__ = "team@example.com"
 
+import logging
+
 from ai_code_audit.core.models import (
     ProjectInfo,
     FileInfo,
@@ -29,6 +31,8 @@ __all__ = [
     "audit_project",
 ]
 
+logger = logging.getLogger(__name__)
+
 # 简化的主入口 - 直接使用核心组件，避免复杂依赖
 async def audit_project(
     project_path: str,
@@ -84,7 +88,6 @@ async def audit_project(
     from .llm.manager import LLMManager
     from .templates.advanced_templates import AdvancedTemplateManager
     from .utils.cache import get_cache
-    import json
     import time
     from datetime import datetime
     from pathlib import Path
@@ -234,13 +237,32 @@ async def audit_project(
 
             async def analyze_single_file(file_info, index):
                 async with semaphore:
-                    return await _analyze_file_async(file_info, index, len(project_info.files),
-                                                   template_manager, template, llm_manager,
-                                                   show_timing, console, project_path)
+                    try:
+                        result = await _analyze_file_async(file_info, index, len(project_info.files),
+                                                           template_manager, template, llm_manager,
+                                                           show_timing, console, project_path)
+                    except Exception as e:
+                        result = e
+                    return index, result
 
             # 创建并发任务
-            tasks = [analyze_single_file(file_info, i) for i, file_info in enumerate(project_info.files)]
-            analysis_results = await asyncio.gather(*tasks, return_exceptions=True)
+            tasks = [asyncio.ensure_future(analyze_single_file(file_info, i))
+                     for i, file_info in enumerate(project_info.files)]
+
+            # 按完成顺序收集结果，实时记录进度；汇总时仍保持文件顺序
+            analysis_results = [None] * len(tasks)
+            try:
+                for completed, future in enumerate(asyncio.as_completed(tasks), 1):
+                    index, result = await future
+                    analysis_results[index] = result
+                    logger.info("文件分析进度: %d/%d", completed, len(tasks))
+            except BaseException:
+                # 被取消或中断时（CancelledError、KeyboardInterrupt等不会被单文件
+                # 的异常处理捕获），取消其余仍在运行的分析任务后再向上抛出
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
             # 处理结果
             for result in analysis_results:
@@ -371,8 +393,7 @@ async def audit_project(
         # 7. 保存结果
         step_start = time.time()
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
+            write_json_report(results, output_file)
             console.print(f"[SUCCESS] 结果已保存到: {output_file}")
 
             # 生成markdown报告
@@ -445,8 +466,35 @@ async def audit_project(
             await llm_manager.close()
 
 
-def generate_markdown_report(results, output_file):
-    """生成Markdown格式的审计报告"""
+def write_json_report(results, output_file):
+    """保存JSON格式的审计结果，安装了orjson时使用orjson加速序列化"""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        try:
+            # orjson直接输出UTF-8字节，效果等同于ensure_ascii=False
+            data = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # 非字符串键等orjson不支持的数据回退到标准库
+            data = None
+        if data is not None:
+            with open(output_file, 'wb') as f:
+                f.write(data)
+            return
+
+    import json
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def generate_markdown_report(results, output_file=None):
+    """生成Markdown格式的审计报告，output_file为None时不写文件，直接返回报告内容"""
+    import io
+    from collections import defaultdict
+    from contextlib import nullcontext
     from datetime import datetime
 
     # 统计数据
@@ -454,20 +502,23 @@ def generate_markdown_report(results, output_file):
     files_analyzed = results.get("total_files", 0)
 
     # 按严重程度分类
-    severity_counts = {}
-    file_findings = {}
+    severity_counts = defaultdict(int)
+    file_findings = defaultdict(list)
 
     for finding in results.get("findings", []):
-        severity = finding.get("severity", "unknown")
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        severity_counts[finding.get("severity", "unknown")] += 1
+        file_findings[finding.get("file", "unknown")].append(finding)
+
+    # 边生成边写入文件，避免在内存中拼接整份报告
+    if output_file is not None:
+        stream = open(output_file, 'w', encoding='utf-8')
+    else:
+        stream = nullcontext(io.StringIO())
 
-        file_path = finding.get("file", "unknown")
-        if file_path not in file_findings:
-            file_findings[file_path] = []
-        file_findings[file_path].append(finding)
+    with stream as f:
+        write = f.write
 
-    # 生成报告内容
-    report_content = f"""# AI代码安全审计报告
+        write(f"""# AI代码安全审计报告
 
 ## 审计概览
 
@@ -478,41 +529,41 @@ def generate_markdown_report(results, output_file):
 
 ## 问题统计
 
-"""
+""")
 
-    if severity_counts:
-        for severity, count in sorted(severity_counts.items()):
-            report_content += f"- **{severity.upper()}**: {count} 个问题\n"
-    else:
-        report_content += "- 未发现安全问题\n"
+        if severity_counts:
+            for severity, count in sorted(severity_counts.items()):
+                write(f"- **{severity.upper()}**: {count} 个问题\n")
+        else:
+            write("- 未发现安全问题\n")
 
-    report_content += "\n## 详细发现\n\n"
+        write("\n## 详细发现\n\n")
 
-    if file_findings:
-        for file_path, findings in file_findings.items():
-            report_content += f"### 文件: {file_path}\n\n"
+        if file_findings:
+            for file_path, findings in file_findings.items():
+                write(f"### 文件: {file_path}\n\n")
 
-            for i, finding in enumerate(findings, 1):
-                severity = finding.get("severity", "unknown").upper()
-                line_number = finding.get("line", "N/A")
+                for i, finding in enumerate(findings, 1):
+                    severity = finding.get("severity", "unknown").upper()
+                    line_number = finding.get("line", "N/A")
 
-                report_content += f"#### {i}. {finding.get('type', '未知问题')} [{severity}]\n\n"
-                report_content += f"- **位置**: 第 {line_number} 行\n"
+                    write(f"#### {i}. {finding.get('type', '未知问题')} [{severity}]\n\n")
+                    write(f"- **位置**: 第 {line_number} 行\n")
 
-                if finding.get("description"):
-                    report_content += f"- **描述**: {finding['description']}\n"
+                    if finding.get("description"):
+                        write(f"- **描述**: {finding['description']}\n")
 
-                if finding.get("code_snippet") and finding['code_snippet'].strip():
-                    report_content += f"\n**代码片段:**\n```{finding.get('language', '')}\n{finding['code_snippet']}\n```\n"
+                    if finding.get("code_snippet") and finding['code_snippet'].strip():
+                        write(f"\n**代码片段:**\n```{finding.get('language', '')}\n{finding['code_snippet']}\n```\n")
 
-                if finding.get("recommendation"):
-                    report_content += f"\n**建议**: {finding['recommendation']}\n"
+                    if finding.get("recommendation"):
+                        write(f"\n**建议**: {finding['recommendation']}\n")
 
-                report_content += "\n---\n\n"
-    else:
-        report_content += "恭喜！未发现任何安全问题。\n\n"
+                    write("\n---\n\n")
+        else:
+            write("恭喜！未发现任何安全问题。\n\n")
 
-    report_content += f"""## 审计总结
+        write(f"""## 审计总结
 
 本次审计共分析了 **{files_analyzed}** 个文件，发现了 **{total_findings}** 个潜在问题。
 
@@ -526,11 +577,10 @@ def generate_markdown_report(results, output_file):
 ---
 
 *报告由AI代码安全审计系统自动生成*
-"""
+""")
 
-    # 写入文件
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+        if output_file is None:
+            return f.getvalue()
 
 
 async def _analyze_file_async(file_info, index, total_files, template_manager, template, llm_manager, show_timing, console, project_path):
@@ -20,14 +20,25 @@ class ConfidenceFactors:
     context_completeness: float = 1.0
     historical_accuracy: float = 1.0
 
-@dataclass
+@dataclass(frozen=True)
 class ConfidenceResult:
     """置信度计算结果"""
+    __slots__ = ('final_score', 'factors', 'reasoning', 'risk_level')
+
     final_score: float
     factors: ConfidenceFactors
     reasoning: List[str]
     risk_level: str
 
+    # 手写__slots__时冻结的实例无法按默认方式复制或反序列化，
+    # 需绕过被禁止的__setattr__恢复状态
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 class ConfidenceCalculator:
     """智能置信度计算器"""
     
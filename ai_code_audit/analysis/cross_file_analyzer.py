@@ -15,6 +15,21 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# 包含/引用语句的匹配模式，模块加载时编译一次
+_INCLUDE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'include\s*[\'"]([^\'"]+)[\'"]',
+    r'require\s*[\'"]([^\'"]+)[\'"]',
+    r'import\s+[\'"]([^\'"]+)[\'"]',
+    r'from\s+[\'"]([^\'"]+)[\'"]',
+))
+
+# 模板引用的匹配模式
+_TEMPLATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'template\s*[\'"]([^\'"]+)[\'"]',
+    r'render\s*[\'"]([^\'"]+)[\'"]',
+    r'include\s*[\'"]([^\'"]+\.html?)[\'"]',
+))
+
 @dataclass
 class RelatedFile:
     """相关文件信息"""
@@ -40,6 +55,11 @@ class CrossFileAnalyzer:
         self.file_cache = {}  # 文件内容缓存
         self.analysis_cache = {}  # 新增：分析结果缓存
         self.search_cache = {}    # 新增：搜索结果缓存
+        self.search_heads = None  # 候选文件头部内容缓存，首次搜索时并发读取
+        self.read_semaphore = asyncio.Semaphore(32)  # 限制并发读文件数，避免耗尽文件描述符
+        self.search_heads_lock = asyncio.Lock()  # 并发搜索时只加载一次候选文件头部
+        self.config_files = None  # 项目配置文件列表，首次使用时扫描
+        self.controller_cache = {}  # 目录 -> 控制器文件列表
         self.semaphore = asyncio.Semaphore(2)  # 限制跨文件分析并发数
         
     async def analyze_uncertain_finding(
@@ -176,7 +196,7 @@ class CrossFileAnalyzer:
         finding_type = finding.get('type', '')
         
         # 1. 查找调用者文件
-        callers = self._find_caller_files(file_path, code)
+        callers = await self._find_caller_files(file_path, code)
         related_files.extend(callers)
         
         # 2. 查找被调用文件
@@ -200,7 +220,7 @@ class CrossFileAnalyzer:
         
         return related_files[:5]  # 限制最多5个相关文件
     
-    def _find_caller_files(self, file_path: str, code: str) -> List[RelatedFile]:
+    async def _find_caller_files(self, file_path: str, code: str) -> List[RelatedFile]:
         """查找调用当前文件的文件"""
         related_files = []
         current_file = Path(file_path)
@@ -213,7 +233,7 @@ class CrossFileAnalyzer:
         
         # 在项目中搜索引用
         for pattern in search_patterns:
-            for found_file in self._search_files_containing(pattern):
+            for found_file in await self._search_files_containing(pattern):
                 if found_file != file_path:
                     related_files.append(RelatedFile(
                         path=found_file,
@@ -229,15 +249,8 @@ class CrossFileAnalyzer:
         related_files = []
         
         # 分析代码中的包含/引用
-        include_patterns = [
-            r'include\s*[\'"]([^\'"]+)[\'"]',
-            r'require\s*[\'"]([^\'"]+)[\'"]',
-            r'import\s+[\'"]([^\'"]+)[\'"]',
-            r'from\s+[\'"]([^\'"]+)[\'"]',
-        ]
-        
-        for pattern in include_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
+        for pattern in _INCLUDE_PATTERNS:
+            matches = pattern.findall(code)
             for match in matches:
                 # 构建可能的文件路径
                 possible_paths = self._resolve_file_path(file_path, match)
@@ -247,49 +260,51 @@ class CrossFileAnalyzer:
                             path=str(path),
                             relationship='callee',
                             confidence=0.8,
-                            reason=f"通过{pattern}引用"
+                            reason=f"通过{pattern.pattern}引用"
                         ))
         
         return related_files[:3]
     
     def _find_config_files(self, file_path: str) -> List[RelatedFile]:
         """查找配置文件"""
-        related_files = []
-        
-        # 常见配置文件
-        config_patterns = [
-            '**/config.php',
-            '**/config.ini',
-            '**/settings.py',
-            '**/application.properties',
-            '**/web.xml',
-            '**/.htaccess'
+        # 配置文件与当前文件无关，整个项目只扫描一次
+        if self.config_files is None:
+            # 常见配置文件
+            config_patterns = [
+                '**/config.php',
+                '**/config.ini',
+                '**/settings.py',
+                '**/application.properties',
+                '**/web.xml',
+                '**/.htaccess'
+            ]
+
+            self.config_files = []
+            for pattern in config_patterns:
+                for config_file in self.project_path.rglob(pattern):
+                    self.config_files.append(config_file)
+                    if len(self.config_files) >= 2:
+                        break
+                if len(self.config_files) >= 2:
+                    break
+
+        return [
+            RelatedFile(
+                path=str(config_file),
+                relationship='config',
+                confidence=0.6,
+                reason="项目配置文件，可能包含安全设置"
+            )
+            for config_file in self.config_files
         ]
-        
-        for pattern in config_patterns:
-            for config_file in self.project_path.rglob(pattern):
-                related_files.append(RelatedFile(
-                    path=str(config_file),
-                    relationship='config',
-                    confidence=0.6,
-                    reason="项目配置文件，可能包含安全设置"
-                ))
-        
-        return related_files[:2]
     
     def _find_template_files(self, file_path: str, code: str) -> List[RelatedFile]:
         """查找模板文件"""
         related_files = []
         
         # 查找模板引用
-        template_patterns = [
-            r'template\s*[\'"]([^\'"]+)[\'"]',
-            r'render\s*[\'"]([^\'"]+)[\'"]',
-            r'include\s*[\'"]([^\'"]+\.html?)[\'"]',
-        ]
-        
-        for pattern in template_patterns:
-            matches = re.findall(pattern, code, re.IGNORECASE)
+        for pattern in _TEMPLATE_PATTERNS:
+            matches = pattern.findall(code)
             for match in matches:
                 possible_paths = self._resolve_file_path(file_path, match)
                 for path in possible_paths:
@@ -310,14 +325,17 @@ class CrossFileAnalyzer:
         
         # 向上查找控制器文件
         for parent in current_path.parents:
-            for controller_file in parent.glob('*Controller*'):
-                if controller_file.is_file():
-                    related_files.append(RelatedFile(
-                        path=str(controller_file),
-                        relationship='parent',
-                        confidence=0.6,
-                        reason="父级控制器，可能包含权限验证"
-                    ))
+            if parent not in self.controller_cache:
+                self.controller_cache[parent] = [
+                    f for f in parent.glob('*Controller*') if f.is_file()
+                ]
+            for controller_file in self.controller_cache[parent]:
+                related_files.append(RelatedFile(
+                    path=str(controller_file),
+                    relationship='parent',
+                    confidence=0.6,
+                    reason="父级控制器，可能包含权限验证"
+                ))
         
         return related_files[:2]
     
@@ -331,10 +349,11 @@ class CrossFileAnalyzer:
     ) -> Dict[str, Any]:
         """分析相关文件"""
         try:
-            # 读取文件内容
+            # 读取文件内容（在线程中读取，不阻塞事件循环）
             if related_file.path not in self.file_cache:
-                with open(related_file.path, 'r', encoding='utf-8', errors='ignore') as f:
-                    self.file_cache[related_file.path] = f.read()
+                self.file_cache[related_file.path] = await asyncio.to_thread(
+                    Path(related_file.path).read_text, encoding='utf-8', errors='ignore'
+                )
             
             related_code = self.file_cache[related_file.path]
             
@@ -452,25 +471,41 @@ class CrossFileAnalyzer:
         else:
             return "跨文件分析未显著改变置信度，建议进一步人工审查"
     
-    def _search_files_containing(self, pattern: str) -> List[str]:
+    async def _search_files_containing(self, pattern: str) -> List[str]:
         """优化的文件搜索，避免全项目扫描"""
-        found_files = []
+        max_results = 5  # 限制结果数量
 
         # 检查搜索缓存
-        if hasattr(self, 'search_cache') and pattern in self.search_cache:
+        if pattern in self.search_cache:
             logger.info(f"Using cached search result for pattern '{pattern}'")
             return self.search_cache[pattern]
 
-        # 1. 限制搜索范围和文件类型
+        # 候选文件内容只读取一次，后续模式直接在内存中匹配；
+        # 加锁避免并发搜索各自重复加载
+        if self.search_heads is None:
+            async with self.search_heads_lock:
+                if self.search_heads is None:
+                    self.search_heads = await self._load_search_heads()
+
+        found_files = [
+            path for path, content in self.search_heads if pattern in content
+        ][:max_results]
+
+        # 缓存搜索结果
+        self.search_cache[pattern] = found_files
+
+        logger.info(f"Searched {len(self.search_heads)} files, found {len(found_files)} matches for pattern '{pattern}'")
+        return found_files
+
+    def _collect_search_candidates(self) -> List[Path]:
+        """收集待搜索的候选文件，限制文件类型、大小和数量"""
         search_extensions = {'.php', '.java', '.py', '.js', '.html', '.jsp', '.xml'}
         max_search_files = 100  # 限制搜索文件数量
-        max_results = 5  # 限制结果数量
-
-        searched_count = 0
 
+        candidates = []
         try:
             for file_path in self.project_path.rglob('*'):
-                if searched_count >= max_search_files:
+                if len(candidates) >= max_search_files:
                     break
 
                 if not file_path.is_file() or file_path.suffix not in search_extensions:
@@ -483,29 +518,36 @@ class CrossFileAnalyzer:
                 except:
                     continue
 
-                searched_count += 1
-
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        # 只读取前10KB内容进行搜索
-                        content = f.read(10240)
-                        if pattern in content:
-                            found_files.append(str(file_path))
-                            if len(found_files) >= max_results:
-                                break
-                except:
-                    continue
+                candidates.append(file_path)
 
         except Exception as e:
             logger.warning(f"File search failed: {e}")
 
-        # 缓存搜索结果
-        if not hasattr(self, 'search_cache'):
-            self.search_cache = {}
-        self.search_cache[pattern] = found_files
+        return candidates
 
-        logger.info(f"Searched {searched_count} files, found {len(found_files)} matches for pattern '{pattern}'")
-        return found_files
+    @staticmethod
+    def _read_search_head(file_path: Path) -> Optional[str]:
+        """读取文件前10KB内容用于搜索，读取失败返回None"""
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read(10240)
+        except:
+            return None
+
+    async def _load_search_heads(self) -> List[Tuple[str, str]]:
+        """并发读取所有候选文件的头部内容，保持项目遍历顺序"""
+        candidates = await asyncio.to_thread(self._collect_search_candidates)
+
+        async def read_head(file_path: Path) -> Optional[str]:
+            async with self.read_semaphore:
+                return await asyncio.to_thread(self._read_search_head, file_path)
+
+        contents = await asyncio.gather(*(read_head(p) for p in candidates))
+        return [
+            (str(path), content)
+            for path, content in zip(candidates, contents)
+            if content is not None
+        ]
 
     def _generate_cache_key(self, finding: Dict[str, Any], file_path: str) -> str:
         """生成缓存键"""
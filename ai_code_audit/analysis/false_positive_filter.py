@@ -181,15 +181,19 @@ class FalsePositiveFilter:
         """
         filtered_findings = []
         
+        # 同一文件的所有问题共享拆分后的代码行
+        lines = code.split('\n')
+        
         for finding in findings:
-            if not self._is_false_positive(finding, file_path, code):
+            if not self._is_false_positive(finding, file_path, code, lines):
                 filtered_findings.append(finding)
             else:
                 logger.debug(f"过滤误报: {finding.get('type', 'unknown')} in {file_path}")
         
         return filtered_findings
     
-    def _is_false_positive(self, finding: Dict[str, Any], file_path: str, code: str) -> bool:
+    def _is_false_positive(self, finding: Dict[str, Any], file_path: str, code: str,
+                           lines: Optional[List[str]] = None) -> bool:
         """
         判断是否为误报
 
@@ -197,6 +201,7 @@ class FalsePositiveFilter:
             finding: 问题信息
             file_path: 文件路径
             code: 源代码
+            lines: 预先拆分的代码行 (可选，未提供时从code拆分)
 
         Returns:
             True if 误报, False otherwise
@@ -227,7 +232,7 @@ class FalsePositiveFilter:
             return True
 
         # 3. 上下文分析过滤
-        if self._is_context_safe(finding, file_path, code, line_number):
+        if self._is_context_safe(finding, file_path, code, line_number, lines):
             return True
 
         # 4. 业务逻辑过滤
@@ -244,12 +249,14 @@ class FalsePositiveFilter:
 
         return False
     
-    def _is_context_safe(self, finding: Dict[str, Any], file_path: str, code: str, line_number: int) -> bool:
+    def _is_context_safe(self, finding: Dict[str, Any], file_path: str, code: str, line_number: int,
+                         lines: Optional[List[str]] = None) -> bool:
         """基于上下文判断是否安全"""
         issue_type = finding.get('type', '')
         
         # 获取问题行的上下文
-        lines = code.split('\n')
+        if lines is None:
+            lines = code.split('\n')
         if line_number <= 0 or line_number > len(lines):
             return False
         
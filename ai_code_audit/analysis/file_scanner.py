@@ -7,6 +7,7 @@ identify source files, and extract basic file information.
 
 import os
 import hashlib
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import List, Set, Optional, Dict, Any
@@ -299,13 +300,13 @@ class FileScanner:
     
     def get_file_count_by_language(self, files: List[FileInfo]) -> Dict[str, int]:
         """Get count of files by programming language."""
-        counts = {}
+        counts = defaultdict(int)
         
         for file_info in files:
             if file_info.language:
-                counts[file_info.language] = counts.get(file_info.language, 0) + 1
+                counts[file_info.language] += 1
         
-        return counts
+        return dict(counts)
     
     def get_total_size(self, files: List[FileInfo]) -> int:
         """Get total size of all files in bytes."""
@@ -10,6 +10,31 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 
+# 表单及其输入字段的匹配模式，模块加载时编译一次
+_FORM_RE = re.compile(
+    r'<form[^>]*action\s*=\s*[\'"]([^\'"]*)[\'"][^>]*method\s*=\s*[\'"]([^\'"]*)[\'"][^>]*>',
+    re.IGNORECASE | re.DOTALL
+)
+_INPUT_RE = re.compile(r'<input[^>]*name\s*=\s*[\'"]([^\'"]*)[\'"][^>]*>', re.IGNORECASE)
+
+# AJAX请求模式
+_AJAX_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\$\.post\s*\(\s*[\'"]([^\'"]*)[\'"]',
+    r'\$\.get\s*\(\s*[\'"]([^\'"]*)[\'"]',
+    r'fetch\s*\(\s*[\'"]([^\'"]*)[\'"]',
+    r'axios\.post\s*\(\s*[\'"]([^\'"]*)[\'"]',
+    r'XMLHttpRequest.*open\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]'
+))
+
+# URL参数模式
+_URL_PARAM_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'location\.search',
+    r'location\.hash',
+    r'window\.location\.href',
+    r'getParameter\s*\(\s*[\'"]([^\'"]*)[\'"]',
+    r'URLSearchParams'
+))
+
 @dataclass
 class InputPoint:
     """前端输入点"""
@@ -24,6 +49,9 @@ class InputPoint:
 @dataclass
 class SecurityHotspot:
     """安全热点"""
+    # 每处匹配都会生成一个实例，使用__slots__省去实例__dict__
+    __slots__ = ('type', 'pattern', 'code_snippet', 'severity', 'line_number', 'description')
+
     type: str  # 'XSS_RISK', 'SENSITIVE_INFO', 'UNSAFE_EVAL'
     pattern: str  # 匹配的模式
     code_snippet: str  # 代码片段
@@ -114,7 +142,25 @@ class FrontendOptimizer:
                 r'document\.URL'
             ]
         }
+
+        # 预编译安全敏感模式，多个文件共用: (热点类型, 模式字符串, 编译后的正则)
+        self.compiled_security_patterns = [
+            (hotspot_type, pattern, re.compile(pattern, re.IGNORECASE))
+            for hotspot_type, patterns in self.security_patterns.items()
+            for pattern in patterns
+        ]
     
+    def analyze_batch(self, files: List[Tuple[str, str]]) -> List[FrontendAnalysisResult]:
+        """批量分析前端文件，所有文件共用预编译的检测模式
+
+        Args:
+            files: (文件路径, 文件内容) 列表
+
+        Returns:
+            与输入顺序一致的分析结果列表
+        """
+        return [self.analyze_frontend_file(file_path, content) for file_path, content in files]
+
     def analyze_frontend_file(self, file_path: str, content: str) -> FrontendAnalysisResult:
         """分析前端文件，决定处理策略"""
         
@@ -193,19 +239,17 @@ class FrontendOptimizer:
         hotspots = []
         lines = content.split('\n')
         
-        for hotspot_type, patterns in self.security_patterns.items():
-            for pattern in patterns:
-                for line_num, line in enumerate(lines, 1):
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
-                    for match in matches:
-                        hotspots.append(SecurityHotspot(
-                            type=hotspot_type,
-                            pattern=pattern,
-                            code_snippet=line.strip(),
-                            severity=self._get_severity(hotspot_type),
-                            line_number=line_num,
-                            description=self._get_hotspot_description(hotspot_type)
-                        ))
+        for hotspot_type, pattern, regex in self.compiled_security_patterns:
+            for line_num, line in enumerate(lines, 1):
+                for match in regex.finditer(line):
+                    hotspots.append(SecurityHotspot(
+                        type=hotspot_type,
+                        pattern=pattern,
+                        code_snippet=line.strip(),
+                        severity=self._get_severity(hotspot_type),
+                        line_number=line_num,
+                        description=self._get_hotspot_description(hotspot_type)
+                    ))
         
         return hotspots
     
@@ -233,8 +277,7 @@ class FrontendOptimizer:
         inputs = []
         
         # 查找表单
-        form_pattern = r'<form[^>]*action\s*=\s*[\'"]([^\'"]*)[\'"][^>]*method\s*=\s*[\'"]([^\'"]*)[\'"][^>]*>'
-        forms = re.finditer(form_pattern, content, re.IGNORECASE | re.DOTALL)
+        forms = _FORM_RE.finditer(content)
         
         for form in forms:
             action = form.group(1)
@@ -249,8 +292,7 @@ class FrontendOptimizer:
             form_content = content[form_start:form_end]
             
             # 查找输入字段
-            input_pattern = r'<input[^>]*name\s*=\s*[\'"]([^\'"]*)[\'"][^>]*>'
-            input_fields = re.finditer(input_pattern, form_content, re.IGNORECASE)
+            input_fields = _INPUT_RE.finditer(form_content)
             
             for field in input_fields:
                 inputs.append(InputPoint(
@@ -268,17 +310,8 @@ class FrontendOptimizer:
         """提取AJAX请求"""
         inputs = []
         
-        # AJAX模式
-        ajax_patterns = [
-            r'\$\.post\s*\(\s*[\'"]([^\'"]*)[\'"]',
-            r'\$\.get\s*\(\s*[\'"]([^\'"]*)[\'"]',
-            r'fetch\s*\(\s*[\'"]([^\'"]*)[\'"]',
-            r'axios\.post\s*\(\s*[\'"]([^\'"]*)[\'"]',
-            r'XMLHttpRequest.*open\s*\(\s*[\'"]([^\'"]*)[\'"]\s*,\s*[\'"]([^\'"]*)[\'"]'
-        ]
-        
-        for pattern in ajax_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in _AJAX_PATTERNS:
+            matches = pattern.finditer(content)
             for match in matches:
                 inputs.append(InputPoint(
                     type='ajax',
@@ -294,17 +327,8 @@ class FrontendOptimizer:
         """提取URL参数"""
         inputs = []
         
-        # URL参数模式
-        url_param_patterns = [
-            r'location\.search',
-            r'location\.hash',
-            r'window\.location\.href',
-            r'getParameter\s*\(\s*[\'"]([^\'"]*)[\'"]',
-            r'URLSearchParams'
-        ]
-        
-        for pattern in url_param_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in _URL_PARAM_PATTERNS:
+            matches = pattern.finditer(content)
             for match in matches:
                 inputs.append(InputPoint(
                     type='url_param',
@@ -6,7 +6,10 @@ environment variables, configuration files, and default settings.
 """
 
 import os
+import copy
+import threading
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
@@ -167,6 +170,48 @@ class AppConfig:
         return asdict(self)
 
 
+@lru_cache(maxsize=8)
+def _discover_config_file(env_config_path: Optional[str], cwd: str) -> Optional[str]:
+    """Find configuration file in standard locations.
+
+    Results are cached per (AI_AUDIT_CONFIG, working directory) pair;
+    ``reload_config`` clears the cache.
+    """
+    # Priority order:
+    # 1. Environment variable
+    # 2. Current directory
+    # 3. User home directory
+    # 4. Project directory and its config subdirectory
+    project_root = Path(__file__).parent.parent.parent
+    candidates = [str(path) for path in (
+        Path('./ai-audit.yaml'),
+        Path('./config.yaml'),
+        Path.home() / '.ai-code-audit' / 'config.yaml',
+        project_root / 'config.yaml',
+        project_root / 'config' / 'config.yaml',
+    )]
+    if env_config_path is not None:
+        candidates.insert(0, env_config_path)
+    
+    # Only the path is cached; the file is stat'ed again when it is loaded
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    
+    return None
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML config file, cached by path and file stat.
+
+    Editing the file changes its mtime/size and therefore the cache key.
+    Callers must copy the result before handing it out.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f) or {}
+
+
 class ConfigManager:
     """Configuration manager with multiple sources support."""
     
@@ -177,42 +222,7 @@ class ConfigManager:
     
     def _find_config_file(self) -> Optional[str]:
         """Find configuration file in standard locations."""
-        # Priority order:
-        # 1. Environment variable
-        # 2. Current directory
-        # 3. User home directory
-        # 4. System config directory
-        
-        if 'AI_AUDIT_CONFIG' in os.environ:
-            config_path = os.environ['AI_AUDIT_CONFIG']
-            if Path(config_path).exists():
-                return config_path
-        
-        # Check current directory
-        current_config = Path('./ai-audit.yaml')
-        if current_config.exists():
-            return str(current_config)
-        
-        current_config = Path('./config.yaml')
-        if current_config.exists():
-            return str(current_config)
-        
-        # Check user home directory
-        home_config = Path.home() / '.ai-code-audit' / 'config.yaml'
-        if home_config.exists():
-            return str(home_config)
-        
-        # Check project directory
-        project_config = Path(__file__).parent.parent.parent / 'config.yaml'
-        if project_config.exists():
-            return str(project_config)
-
-        # Check config subdirectory
-        config_dir_config = Path(__file__).parent.parent.parent / 'config' / 'config.yaml'
-        if config_dir_config.exists():
-            return str(config_dir_config)
-
-        return None
+        return _discover_config_file(os.environ.get('AI_AUDIT_CONFIG'), os.getcwd())
     
     def load_config(self) -> AppConfig:
         """Load configuration from all sources."""
@@ -242,8 +252,11 @@ class ConfigManager:
     
     def _load_from_file(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        # Stat at load time so an edited file gets a new cache key
+        stat = os.stat(config_path)
+        # The merged config keeps references to lists from the parsed file,
+        # so never hand out the cached dict itself
+        return copy.deepcopy(_load_yaml_cached(config_path, stat.st_mtime_ns, stat.st_size))
     
     def _load_from_env(self, config: AppConfig) -> AppConfig:
         """Load configuration from environment variables."""
@@ -434,15 +447,20 @@ class ConfigManager:
         
         return base_config
     
-    def _validate_config(self, config: AppConfig) -> None:
-        """Validate configuration."""
-        # Validate database configuration
-        if not config.database.host:
+    @staticmethod
+    def _validate_database(database: DatabaseConfig) -> None:
+        """Validate database configuration."""
+        if not database.host:
             raise ValueError("Database host is required")
-        if not config.database.username:
+        if not database.username:
             raise ValueError("Database username is required")
-        if not config.database.database:
+        if not database.database:
             raise ValueError("Database name is required")
+    
+    def _validate_config(self, config: AppConfig) -> None:
+        """Validate configuration."""
+        # Validate database configuration
+        self._validate_database(config.database)
         
         # Validate LLM configuration
         if not config.llm.qwen and not config.llm.kimi:
@@ -569,13 +587,16 @@ class ConfigManager:
 
 # Global configuration manager instance
 _config_manager: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager() -> ConfigManager:
     """Get global configuration manager instance."""
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager()
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager()
     return _config_manager
 
 
@@ -587,5 +608,8 @@ def get_config() -> AppConfig:
 def reload_config() -> AppConfig:
     """Reload configuration from sources."""
     global _config_manager
-    _config_manager = None
+    with _config_manager_lock:
+        _config_manager = None
+        _discover_config_file.cache_clear()
+        _load_yaml_cached.cache_clear()
     return get_config()
@@ -7,7 +7,7 @@ for LLM provider implementations.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import ClassVar, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -25,6 +25,21 @@ class LLMModelType(Enum):
     # Kimi models (through SiliconFlow)
     KIMI_K2 = "moonshotai/Kimi-K2-Instruct"
 
+    @classmethod
+    def qwen_models(cls) -> Tuple["LLMModelType", ...]:
+        """Get all Qwen model types."""
+        return _QWEN_MODELS
+
+    @classmethod
+    def kimi_models(cls) -> Tuple["LLMModelType", ...]:
+        """Get all Kimi model types."""
+        return _KIMI_MODELS
+
+
+# Model families, derived once from the enum members
+_QWEN_MODELS = tuple(model for model in LLMModelType if model.name.startswith('QWEN'))
+_KIMI_MODELS = tuple(model for model in LLMModelType if model.name.startswith('KIMI'))
+
 
 class MessageRole(Enum):
     """Message roles in conversation."""
@@ -146,6 +161,13 @@ class LLMResponse:
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    # Maximum context lengths per model - providers override these maps
+    MAX_CONTEXT: ClassVar[Dict[LLMModelType, int]] = {
+        LLMModelType.QWEN_CODER_30B: 262144,  # 256K tokens (262,144)
+        LLMModelType.KIMI_K2: 128000,         # 128K tokens
+    }
+    DEFAULT_CONTEXT: ClassVar[int] = 4096
+    
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """Initialize provider with API key and optional base URL."""
         self.api_key = api_key
@@ -209,12 +231,7 @@ class BaseLLMProvider(ABC):
     
     def get_max_context_length(self, model: LLMModelType) -> int:
         """Get maximum context length for model."""
-        # Default context lengths - should be overridden by providers
-        context_lengths = {
-            LLMModelType.QWEN_CODER_30B: 262144,  # 256K tokens (262,144)
-            LLMModelType.KIMI_K2: 128000,         # 128K tokens
-        }
-        return context_lengths.get(model, 4096)
+        return self.MAX_CONTEXT.get(model, self.DEFAULT_CONTEXT)
     
     def estimate_tokens(self, text: str) -> int:
         """Estimate token count for text (rough approximation)."""
@@ -74,6 +74,13 @@ class CircuitBreaker:
         elif self.state == CircuitState.HALF_OPEN:
             self.state = CircuitState.OPEN
             logger.warning("Circuit breaker returning to OPEN state")
+    
+    def reset(self):
+        """重置为关闭状态并清空计数"""
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.last_failure_time = 0
 
 
 class AdaptiveConcurrencyManager:
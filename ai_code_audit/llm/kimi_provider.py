@@ -8,7 +8,7 @@ through the SiliconFlow API service (same as Qwen).
 import asyncio
 import json
 import time
-from typing import List, Dict, Any, Optional
+from typing import ClassVar, List, Dict, Any, Optional
 import logging
 import aiohttp
 
@@ -25,6 +25,11 @@ logger = logging.getLogger(__name__)
 class KimiProvider(BaseLLMProvider):
     """Kimi LLM provider using SiliconFlow API."""
 
+    MAX_CONTEXT: ClassVar[Dict[LLMModelType, int]] = {
+        LLMModelType.KIMI_K2: 128000,     # 128K context for K2 model
+    }
+    DEFAULT_CONTEXT: ClassVar[int] = 128000
+
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """
         Initialize Kimi provider.
@@ -55,13 +60,6 @@ class KimiProvider(BaseLLMProvider):
             LLMModelType.KIMI_K2,
         ]
 
-    def get_max_context_length(self, model: LLMModelType) -> int:
-        """Get maximum context length for Kimi models."""
-        context_lengths = {
-            LLMModelType.KIMI_K2: 128000,     # 128K context for K2 model
-        }
-        return context_lengths.get(model, 128000)
-
     async def chat_completion(self, request: LLMRequest) -> LLMResponse:
         """
         Send chat completion request to Kimi API.
@@ -6,7 +6,11 @@ and handling load balancing, fallback, and cost optimization.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+import hashlib
+from collections import OrderedDict
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -25,6 +29,9 @@ from ai_code_audit.analysis.universal_false_positive_filter import UniversalFals
 
 logger = logging.getLogger(__name__)
 
+# 代码分析响应缓存的最大条目数
+RESPONSE_CACHE_SIZE = 1024
+
 
 class LoadBalancingStrategy(Enum):
     """Load balancing strategies for multiple providers."""
@@ -62,6 +69,8 @@ class LLMManager:
         self.request_counts: Dict[str, int] = {}
         self.last_used_provider: Optional[str] = None
         self.load_balancing_strategy = LoadBalancingStrategy.COST_OPTIMIZED
+        # 代码分析响应缓存（LRU），相同提示词不重复请求LLM
+        self.response_cache: "OrderedDict[str, LLMResponse]" = OrderedDict()
 
         # 初始化并发管理器
         if config:
@@ -261,6 +270,56 @@ class LLMManager:
             raise last_error
         else:
             raise LLMError("No suitable providers available for request")
+
+    @staticmethod
+    def sort_by_prefix(requests: List[LLMRequest]) -> List[LLMRequest]:
+        """
+        Order requests so that those sharing a message prefix are adjacent.
+
+        Requests are sorted by model and then by their message sequence, which
+        places requests with the longest common prefix (e.g. the same system
+        prompt) next to each other so provider-side prefix caches can be reused.
+        The sort is stable, and the input list is not modified.
+
+        Args:
+            requests: LLM requests to order
+
+        Returns:
+            New list of the same requests grouped by shared prefix
+        """
+        return sorted(
+            requests,
+            key=lambda request: (
+                request.model.value,
+                [(message.role.value, message.content) for message in request.messages]
+            )
+        )
+
+    async def batch_chat_completion(
+        self,
+        requests: List[LLMRequest],
+        preferred_provider: Optional[str] = None,
+        fallback: bool = True
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Send several chat completion requests concurrently.
+
+        The configured providers expose no multi-prompt endpoint, so the
+        requests are issued together and throttled by the concurrency manager
+        and rate limiter like individual calls.
+
+        Args:
+            requests: LLM requests to send
+            preferred_provider: Preferred provider name (optional)
+            fallback: Whether to try other providers if preferred fails
+
+        Returns:
+            Responses in request order; a failed request yields its exception
+        """
+        return await asyncio.gather(
+            *(self.chat_completion(request, preferred_provider, fallback) for request in requests),
+            return_exceptions=True
+        )
     
     def _get_provider_order(self, request: LLMRequest, preferred_provider: Optional[str] = None) -> List[str]:
         """Get ordered list of providers to try for the request."""
@@ -317,28 +376,38 @@ class LLMManager:
         return sorted(providers, key=lambda p: self.provider_configs[p].performance_weight)
     
     async def validate_providers(self) -> Dict[str, bool]:
-        """Validate all configured providers."""
-        results = {}
+        """Validate all configured providers concurrently."""
+        names = list(self.providers)
+        outcomes = await asyncio.gather(
+            *(self.providers[name].validate_api_key() for name in names),
+            return_exceptions=True
+        )
         
-        for name, provider in self.providers.items():
-            try:
-                is_valid = await provider.validate_api_key()
-                results[name] = is_valid
-                logger.info(f"Provider {name} validation: {'✓' if is_valid else '✗'}")
-            except Exception as e:
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
                 results[name] = False
-                logger.error(f"Provider {name} validation failed: {e}")
+                logger.error(f"Provider {name} validation failed: {outcome}")
+            else:
+                results[name] = outcome
+                logger.info(f"Provider {name} validation: {'✓' if outcome else '✗'}")
         
         return results
     
-    def get_available_models(self) -> Dict[str, List[LLMModelType]]:
-        """Get available models for each provider."""
-        models = {}
+    @cached_property
+    def available_models(self) -> Mapping[str, Tuple[LLMModelType, ...]]:
+        """Read-only view of the models supported by each provider.
         
-        for name, provider in self.providers.items():
-            models[name] = provider.supported_models
-        
-        return models
+        Cached until a provider is added or removed.
+        """
+        return MappingProxyType({
+            name: tuple(provider.supported_models)
+            for name, provider in self.providers.items()
+        })
+    
+    def get_available_models(self) -> Mapping[str, Tuple[LLMModelType, ...]]:
+        """Get available models for each provider."""
+        return self.available_models
     
     def get_provider_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all providers."""
@@ -370,6 +439,10 @@ class LLMManager:
         """获取并发控制统计信息"""
         return self.concurrency_manager.get_stats()
 
+    def reset_circuit_breaker(self):
+        """重置熔断器，供复用同一管理器的场景恢复初始状态"""
+        self.concurrency_manager.circuit_breaker.reset()
+
     def get_provider_stats(self) -> Dict:
         """获取提供商统计信息"""
         return {
@@ -402,6 +475,7 @@ class LLMManager:
         self.providers[name] = provider
         self.provider_configs[name] = config
         self.request_counts[name] = 0
+        self.__dict__.pop('available_models', None)
         logger.info(f"Added provider: {name}")
     
     def remove_provider(self, name: str):
@@ -410,6 +484,7 @@ class LLMManager:
             del self.providers[name]
             del self.provider_configs[name]
             del self.request_counts[name]
+            self.__dict__.pop('available_models', None)
             logger.info(f"Removed provider: {name}")
     
     def enable_provider(self, name: str):
@@ -424,6 +499,15 @@ class LLMManager:
             self.provider_configs[name].enabled = False
             logger.info(f"Disabled provider: {name}")
 
+    @staticmethod
+    def _response_cache_key(request: LLMRequest) -> str:
+        """根据模型、采样参数和消息内容生成响应缓存键"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{request.model.value}:{request.temperature}:{request.max_tokens}".encode())
+        for message in request.messages:
+            digest.update(b"\0" + message.role.value.encode() + b"\0" + message.content.encode())
+        return digest.hexdigest()
+
     async def analyze_code(
         self,
         code: str,
@@ -503,8 +587,17 @@ class LLMManager:
         )
 
         try:
-            # 调用LLM进行分析
-            response = await self.chat_completion(request)
+            # 调用LLM进行分析，相同请求直接复用缓存的响应
+            cache_key = self._response_cache_key(request)
+            response = self.response_cache.get(cache_key)
+            if response is not None:
+                self.response_cache.move_to_end(cache_key)
+                logger.info(f"Using cached LLM response for {file_path}")
+            else:
+                response = await self.chat_completion(request)
+                self.response_cache[cache_key] = response
+                if len(self.response_cache) > RESPONSE_CACHE_SIZE:
+                    self.response_cache.popitem(last=False)
 
             # 调试：打印响应格式
             logger.info(f"LLM response type: {type(response)}")
@@ -8,7 +8,7 @@ through the SiliconFlow API service.
 import asyncio
 import json
 import time
-from typing import List, Dict, Any, Optional
+from typing import ClassVar, List, Dict, Any, Optional
 import logging
 
 from ai_code_audit.llm.base import (
@@ -23,6 +23,11 @@ logger = logging.getLogger(__name__)
 class QwenProvider(BaseLLMProvider):
     """Qwen LLM provider using SiliconFlow API."""
     
+    MAX_CONTEXT: ClassVar[Dict[LLMModelType, int]] = {
+        LLMModelType.QWEN_CODER_30B: 262144,  # 256K tokens (262,144)
+    }
+    DEFAULT_CONTEXT: ClassVar[int] = 262144
+    
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """
         Initialize Qwen provider.
@@ -50,13 +55,6 @@ class QwenProvider(BaseLLMProvider):
             LLMModelType.QWEN_CODER_30B,
         ]
     
-    def get_max_context_length(self, model: LLMModelType) -> int:
-        """Get maximum context length for Qwen models."""
-        context_lengths = {
-            LLMModelType.QWEN_CODER_30B: 262144,  # 256K tokens (262,144)
-        }
-        return context_lengths.get(model, 262144)
-    
     async def chat_completion(self, request: LLMRequest) -> LLMResponse:
         """
         Send chat completion request to Qwen API.
@@ -170,6 +170,7 @@ class AdaptiveRateLimiter:
         
         # 动态token估算
         self.token_history = deque(maxlen=100)  # 保留最近100次的实际token使用
+        self._token_history_sum = 0  # token_history的累计和，避免每次重新求和
         self.default_token_estimate = 5000
     
     async def acquire_with_estimation(self, content_length: int = 0) -> bool:
@@ -202,7 +203,7 @@ class AdaptiveRateLimiter:
             return self.default_token_estimate
         
         # 基于历史数据的动态估算
-        avg_tokens = sum(self.token_history) / len(self.token_history)
+        avg_tokens = self._token_history_sum / len(self.token_history)
         
         if content_length > 0:
             # 根据内容长度调整
@@ -215,12 +216,16 @@ class AdaptiveRateLimiter:
     
     def record_actual_usage(self, actual_tokens: int):
         """记录实际token使用量"""
+        if len(self.token_history) == self.token_history.maxlen:
+            # 最旧的记录即将被挤出
+            self._token_history_sum -= self.token_history[0]
         self.token_history.append(actual_tokens)
+        self._token_history_sum += actual_tokens
         self.success_count += 1
         
         # 更新默认估算
         if len(self.token_history) >= 10:
-            self.default_token_estimate = int(sum(self.token_history) / len(self.token_history))
+            self.default_token_estimate = int(self._token_history_sum / len(self.token_history))
     
     def record_error(self):
         """记录错误"""
@@ -236,7 +241,7 @@ class AdaptiveRateLimiter:
         
         avg_tokens = 0
         if self.token_history:
-            avg_tokens = sum(self.token_history) / len(self.token_history)
+            avg_tokens = self._token_history_sum / len(self.token_history)
         
         base_stats.update({
             "success_count": self.success_count,
@@ -132,17 +132,14 @@ class LLMCache:
             缓存统计数据
         """
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_files = len(cache_files)
-            total_size = sum(f.stat().st_size for f in cache_files)
+            # 每个文件只stat一次，大小和过期判断共用结果
+            cache_stats = [f.stat() for f in self.cache_dir.glob("*.json")]
+            total_files = len(cache_stats)
+            total_size = sum(st.st_size for st in cache_stats)
             
             # 计算过期文件数
-            current_time = time.time()
-            expired_files = 0
-            for cache_file in cache_files:
-                file_age = current_time - cache_file.stat().st_mtime
-                if file_age > self.ttl_seconds:
-                    expired_files += 1
+            expire_before = time.time() - self.ttl_seconds
+            expired_files = sum(1 for st in cache_stats if st.st_mtime < expire_before)
             
             return {
                 'total_files': total_files,
@@ -0,0 +1,20 @@
+"""
+Fixtures shared by all test suites.
+
+The LLM manager is created once per test session so that provider HTTP
+sessions, rate limiter state and concurrency statistics are reused instead
+of being rebuilt by every test. It lives on the session event loop, so
+async tests that use it must run with ``loop_scope="session"``.
+"""
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def llm_manager():
+    """LLM manager shared by all tests."""
+    from ai_code_audit.llm.manager import LLMManager
+
+    manager = LLMManager()
+    yield manager
+    await manager.close()
@@ -0,0 +1,88 @@
+"""
+Shared fixtures for integration tests.
+
+LLM providers and the project analysis are created once per test session so
+that HTTP sessions and project analysis are reused across tests. Each test
+that needs a coverage tracker gets its own, since trackers are mutated. The
+shared LLM manager fixture lives in ``tests/conftest.py``. Providers live on
+the session event loop, so async tests that use them must run with
+``loop_scope="session"``.
+
+Provider validation hits the real API. Tests that only need a manager to
+report its providers can request ``mock_validate`` to skip the network.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+
+
+@pytest.fixture
+def mock_validate(monkeypatch):
+    """Skip the network round-trip in LLMManager.validate_providers."""
+    from ai_code_audit.llm.manager import LLMManager
+
+    monkeypatch.setattr(
+        LLMManager, 'validate_providers',
+        AsyncMock(return_value={'qwen': True, 'kimi': True})
+    )
+
+
+@pytest.fixture(scope="session")
+def app_config():
+    """Application configuration loaded once per session."""
+    from ai_code_audit.core.config import get_config
+
+    return get_config()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def qwen_provider(app_config):
+    """Qwen provider built from the loaded configuration."""
+    from ai_code_audit.llm.qwen_provider import QwenProvider
+
+    qwen_config = app_config.llm.qwen
+    if qwen_config is None:
+        pytest.skip("Qwen provider is not configured")
+    provider = QwenProvider(
+        api_key=qwen_config.api_key,
+        base_url=qwen_config.base_url
+    )
+    yield provider
+    await provider.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def kimi_provider(app_config):
+    """Kimi provider built from the loaded configuration."""
+    from ai_code_audit.llm.kimi_provider import KimiProvider
+
+    kimi_config = app_config.llm.kimi
+    if kimi_config is None:
+        pytest.skip("Kimi provider is not configured")
+    provider = KimiProvider(
+        api_key=kimi_config.api_key,
+        base_url=kimi_config.base_url
+    )
+    yield provider
+    await provider.close()
+
+
+@pytest.fixture(scope="session")
+def project_info():
+    """Analysis of the current project, computed once per session."""
+    from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
+
+    return asyncio.run(ProjectAnalyzer().analyze_project('.'))
+
+
+@pytest.fixture
+def coverage_tracker(request):
+    """Fresh coverage tracker per test, built from the shared project analysis."""
+    tracker_module = pytest.importorskip("ai_code_audit.analysis.coverage_tracker")
+    # Requested only after the import check, so a skip does not analyze the project
+    project_info = request.getfixturevalue("project_info")
+    return tracker_module.CoverageTracker(project_info)
+
@@ -10,11 +10,43 @@ import sys
 import aiohttp
 import json
 from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import simdjson
+except ImportError:  # simdjson is optional; fall back to the stdlib parser
+    simdjson = None
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from tests.output_capture import buffered_output
+
+# Reused across calls so simdjson can keep its internal buffers
+_JSON_PARSER = simdjson.Parser() if simdjson is not None else None
+
+
+def _extract_completion(body: bytes):
+    """Return the reply text and total token usage from a chat completion body."""
+    if _JSON_PARSER is None:
+        data = json.loads(body)
+        content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
+        tokens = data.get('usage', {}).get('total_tokens', 0)
+        return content, tokens
+    
+    # Only the two fields we need are materialized as Python objects
+    doc = _JSON_PARSER.parse(body)
+    try:
+        content = str(doc.at_pointer('/choices/0/message/content'))
+    except (KeyError, IndexError, TypeError, ValueError):
+        content = ''
+    try:
+        tokens = int(doc.at_pointer('/usage/total_tokens'))
+    except (KeyError, IndexError, TypeError, ValueError):
+        tokens = 0
+    return content, tokens
+
 
 async def test_api_key(api_key: str, model_name: str, provider_name: str):
     """Test a specific API key with a model."""
@@ -41,9 +73,7 @@ async def test_api_key(api_key: str, model_name: str, provider_name: str):
         async with aiohttp.ClientSession() as session:
             async with session.post(url, headers=headers, json=payload) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    tokens = data.get('usage', {}).get('total_tokens', 0)
+                    content, tokens = _extract_completion(await response.read())
                     print(f"✅ {provider_name} API key works!")
                     print(f"   Response: {content[:50]}...")
                     print(f"   Tokens used: {tokens}")
@@ -60,10 +90,17 @@ async def test_api_key(api_key: str, model_name: str, provider_name: str):
         return False
 
 
-async def test_configuration_keys():
-    """Test API keys from configuration."""
+@buffered_output
+async def test_configuration_keys(validation: Optional[Dict[str, bool]] = None):
+    """Test API keys from configuration.
+
+    Providers already present in ``validation`` (as returned by
+    ``LLMManager.validate_providers``) are not validated again.
+    """
     print("🔍 Testing API keys from configuration...")
     
+    validation = validation or {}
+    
     try:
         from ai_code_audit.core.config import get_config
         
@@ -73,11 +110,15 @@ async def test_configuration_keys():
         
         # Test Qwen key
         if config.llm.qwen and config.llm.qwen.api_key:
-            result = await test_api_key(
-                config.llm.qwen.api_key,
-                "Qwen/Qwen3-Coder-30B-A3B-Instruct",
-                "Qwen"
-            )
+            if "qwen" in validation:
+                result = validation["qwen"]
+                print(f"\n🔍 Reusing Qwen validation result: {'✅ Valid' if result else '❌ Invalid'}")
+            else:
+                result = await test_api_key(
+                    config.llm.qwen.api_key,
+                    "Qwen/Qwen3-Coder-30B-A3B-Instruct",
+                    "Qwen"
+                )
             results.append(("Qwen", result))
         else:
             print("❌ Qwen configuration not found")
@@ -85,11 +126,15 @@ async def test_configuration_keys():
         
         # Test Kimi key
         if config.llm.kimi and config.llm.kimi.api_key:
-            result = await test_api_key(
-                config.llm.kimi.api_key,
-                "moonshotai/Kimi-K2-Instruct",
-                "Kimi"
-            )
+            if "kimi" in validation:
+                result = validation["kimi"]
+                print(f"\n🔍 Reusing Kimi validation result: {'✅ Valid' if result else '❌ Invalid'}")
+            else:
+                result = await test_api_key(
+                    config.llm.kimi.api_key,
+                    "moonshotai/Kimi-K2-Instruct",
+                    "Kimi"
+                )
             results.append(("Kimi", result))
         else:
             print("❌ Kimi configuration not found")
@@ -102,6 +147,7 @@ async def test_configuration_keys():
         return []
 
 
+@buffered_output
 async def test_environment_keys():
     """Test API keys from environment variables."""
     print("\n🔍 Testing API keys from environment variables...")
@@ -139,6 +185,7 @@ async def test_environment_keys():
     return results
 
 
+@buffered_output
 async def test_hardcoded_keys():
     """Test the specific API keys you provided."""
     print("\n🔍 Testing hardcoded API keys...")
@@ -168,19 +215,27 @@ async def test_hardcoded_keys():
     return results
 
 
-async def test_provider_validation():
-    """Test provider validation through LLM manager."""
+@buffered_output
+async def test_provider_validation(manager=None, validation: Optional[Dict[str, bool]] = None):
+    """Test provider validation through LLM manager.
+
+    When ``manager`` and ``validation`` are supplied the existing results are
+    reported instead of validating every provider a second time.
+    """
     print("\n🔍 Testing provider validation through LLM manager...")
     
+    owns_manager = manager is None
+    
     try:
-        from ai_code_audit.llm.manager import LLMManager
-        
-        manager = LLMManager()
+        if owns_manager:
+            from ai_code_audit.llm.manager import LLMManager
+            
+            manager = LLMManager()
         
         print(f"✅ LLM manager initialized with {len(manager.providers)} providers")
         
         # Test provider validation
-        validation_results = await manager.validate_providers()
+        validation_results = validation if validation is not None else await manager.validate_providers()
         
         results = []
         for provider, is_valid in validation_results.items():
@@ -188,8 +243,6 @@ async def test_provider_validation():
             print(f"   {provider}: {status}")
             results.append((provider, is_valid))
         
-        await manager.close()
-        
         return results
         
     except Exception as e:
@@ -197,6 +250,10 @@ async def test_provider_validation():
         import traceback
         traceback.print_exc()
         return []
+    
+    finally:
+        if owns_manager and manager is not None:
+            await manager.close()
 
 
 async def main():
@@ -204,23 +261,32 @@ async def main():
     print("🚀 API Key Validation Test")
     print("=" * 50)
     
-    all_results = []
-    
-    # Test configuration keys
-    config_results = await test_configuration_keys()
-    all_results.extend(config_results)
+    from ai_code_audit.llm.manager import LLMManager
     
-    # Test environment keys
-    env_results = await test_environment_keys()
-    all_results.extend(env_results)
-    
-    # Test hardcoded keys
-    hardcoded_results = await test_hardcoded_keys()
-    all_results.extend(hardcoded_results)
+    all_results = []
     
-    # Test provider validation
-    provider_results = await test_provider_validation()
-    all_results.extend(provider_results)
+    # Validate configured providers once and share the results
+    manager = LLMManager()
+    try:
+        validation = await manager.validate_providers()
+        
+        # Test configuration keys
+        config_results = await test_configuration_keys(validation)
+        all_results.extend(config_results)
+        
+        # Test environment keys
+        env_results = await test_environment_keys()
+        all_results.extend(env_results)
+        
+        # Test hardcoded keys
+        hardcoded_results = await test_hardcoded_keys()
+        all_results.extend(hardcoded_results)
+        
+        # Test provider validation
+        provider_results = await test_provider_validation(manager, validation)
+        all_results.extend(provider_results)
+    finally:
+        await manager.close()
     
     # Summary
     print("\n" + "=" * 50)
@@ -228,14 +294,12 @@ async def main():
     print("-" * 30)
     
     valid_count = 0
-    total_count = 0
+    total_count = len(all_results)
     
     for name, is_valid in all_results:
         status = "✅ Valid" if is_valid else "❌ Invalid"
         print(f"{name}: {status}")
-        if is_valid:
-            valid_count += 1
-        total_count += 1
+        valid_count += bool(is_valid)
     
     print(f"\nResult: {valid_count}/{total_count} tests passed")
     
@@ -253,5 +317,5 @@ async def main():
     return 0 if valid_count > 0 else 1
 
 
-if __name__ == "__main__":
-    exit(asyncio.run(main()))
+if __name__ == "__main__" and "pytest" not in sys.modules:
+    sys.exit(asyncio.run(main()))
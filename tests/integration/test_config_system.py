@@ -9,19 +9,36 @@ file loading, environment variables, and configuration validation.
 import os
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from ai_code_audit.core.config import (
+    get_config, reload_config, ConfigManager, AppConfig, DatabaseConfig
+)
+from ai_code_audit.llm.manager import LLMManager
+from tests.output_capture import buffered_output
 
+# Prefix used when printing masked API keys
+_MASK = '*' * 20
+
+
+def _mask_key(key):
+    """Return the API key with everything but its last 8 characters masked."""
+    return f"{_MASK}{key[-8:]}" if key else "Not set"
+
+# Environment for the end-to-end CLI run: no bytecode writes or user site-packages
+_CLI_ENV = {**os.environ, 'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONNOUSERSITE': '1'}
+
+
+@buffered_output
 def test_config_loading():
     """Test configuration loading from file."""
     print("🔍 Testing configuration loading...")
     
     try:
-        from ai_code_audit.core.config import get_config, ConfigManager
-        
         # Test loading configuration
         config = get_config()
         print("✅ Configuration loaded successfully")
@@ -32,11 +49,11 @@ def test_config_loading():
         # Test LLM configuration
         if config.llm.qwen:
             print(f"✅ Qwen provider configured: {config.llm.qwen.enabled}")
-            print(f"   API Key: {'*' * 20 + config.llm.qwen.api_key[-8:] if config.llm.qwen.api_key else 'Not set'}")
+            print(f"   API Key: {_mask_key(config.llm.qwen.api_key)}")
         
         if config.llm.kimi:
             print(f"✅ Kimi provider configured: {config.llm.kimi.enabled}")
-            print(f"   API Key: {'*' * 20 + config.llm.kimi.api_key[-8:] if config.llm.kimi.api_key else 'Not set'}")
+            print(f"   API Key: {_mask_key(config.llm.kimi.api_key)}")
         
         # Test audit configuration
         print(f"✅ Audit config: max {config.audit.max_files_per_audit} files, {len(config.audit.supported_languages)} languages")
@@ -48,51 +65,36 @@ def test_config_loading():
         return False
 
 
+@buffered_output
 def test_environment_override():
     """Test environment variable override."""
     print("\n🔍 Testing environment variable override...")
     
     try:
-        # Set test environment variables
-        original_qwen_key = os.environ.get('QWEN_API_KEY')
-        original_kimi_key = os.environ.get('KIMI_API_KEY')
-        
-        os.environ['QWEN_API_KEY'] = 'test-qwen-key-from-env'
-        os.environ['KIMI_API_KEY'] = 'test-kimi-key-from-env'
-        os.environ['LOG_LEVEL'] = 'DEBUG'
-        
-        # Reload configuration
-        from ai_code_audit.core.config import reload_config
-        config = reload_config()
-        
-        # Check if environment variables took effect
-        if config.llm.qwen and config.llm.qwen.api_key == 'test-qwen-key-from-env':
-            print("✅ Environment variable override works for Qwen")
-        else:
-            print("❌ Environment variable override failed for Qwen")
-        
-        if config.llm.kimi and config.llm.kimi.api_key == 'test-kimi-key-from-env':
-            print("✅ Environment variable override works for Kimi")
-        else:
-            print("❌ Environment variable override failed for Kimi")
-        
-        if config.log_level == 'DEBUG':
-            print("✅ Environment variable override works for log level")
-        else:
-            print("❌ Environment variable override failed for log level")
-        
-        # Restore original environment
-        if original_qwen_key:
-            os.environ['QWEN_API_KEY'] = original_qwen_key
-        else:
-            os.environ.pop('QWEN_API_KEY', None)
-        
-        if original_kimi_key:
-            os.environ['KIMI_API_KEY'] = original_kimi_key
-        else:
-            os.environ.pop('KIMI_API_KEY', None)
-        
-        os.environ.pop('LOG_LEVEL', None)
+        # Set test environment variables; restored when the block exits
+        with patch.dict(os.environ, {
+            'QWEN_API_KEY': 'test-qwen-key-from-env',
+            'KIMI_API_KEY': 'test-kimi-key-from-env',
+            'LOG_LEVEL': 'DEBUG',
+        }):
+            # Reload configuration
+            config = reload_config()
+            
+            # Check if environment variables took effect
+            if config.llm.qwen and config.llm.qwen.api_key == 'test-qwen-key-from-env':
+                print("✅ Environment variable override works for Qwen")
+            else:
+                print("❌ Environment variable override failed for Qwen")
+            
+            if config.llm.kimi and config.llm.kimi.api_key == 'test-kimi-key-from-env':
+                print("✅ Environment variable override works for Kimi")
+            else:
+                print("❌ Environment variable override failed for Kimi")
+            
+            if config.log_level == 'DEBUG':
+                print("✅ Environment variable override works for log level")
+            else:
+                print("❌ Environment variable override failed for log level")
         
         return True
         
@@ -101,20 +103,15 @@ def test_environment_override():
         return False
 
 
+@buffered_output
 def test_config_validation():
     """Test configuration validation."""
     print("\n🔍 Testing configuration validation...")
     
     try:
-        from ai_code_audit.core.config import ConfigManager, AppConfig, DatabaseConfig
-        
         # Test with invalid database config
         try:
-            config = AppConfig()
-            config.database.host = ""  # Invalid empty host
-            
-            manager = ConfigManager()
-            manager._validate_config(config)
+            ConfigManager._validate_database(DatabaseConfig(host=""))  # Invalid empty host
             print("❌ Validation should have failed for empty host")
             return False
             
@@ -140,24 +137,24 @@ def test_config_validation():
         return False
 
 
+@buffered_output
 def test_config_file_discovery():
     """Test configuration file discovery."""
     print("\n🔍 Testing configuration file discovery...")
     
     try:
-        from ai_code_audit.core.config import ConfigManager
-        
         manager = ConfigManager()
         config_path = manager._find_config_file()
         
         if config_path:
             print(f"✅ Found configuration file: {config_path}")
             
-            # Check if file exists
-            if Path(config_path).exists():
-                print("✅ Configuration file exists and is readable")
+            # Discovery caches only the path, so check the file as it is now
+            size = os.stat(config_path).st_size
+            if size > 0:
+                print(f"✅ Configuration file exists ({size} bytes)")
             else:
-                print("❌ Configuration file path found but file doesn't exist")
+                print("❌ Configuration file found but it is empty")
                 return False
         else:
             print("⚠️  No configuration file found (using defaults)")
@@ -169,25 +166,22 @@ def test_config_file_discovery():
         return False
 
 
-def test_llm_manager_integration():
+@buffered_output
+def test_llm_manager_integration(llm_manager):
     """Test LLM manager integration with configuration."""
     print("\n🔍 Testing LLM manager integration...")
     
     try:
-        from ai_code_audit.llm.manager import LLMManager
-        
-        # Initialize LLM manager (should use configuration system)
-        manager = LLMManager()
-        
-        print(f"✅ LLM manager initialized with {len(manager.providers)} providers")
+        # The manager is built from the configuration system
+        print(f"✅ LLM manager initialized with {len(llm_manager.providers)} providers")
         
         # Check provider configuration
-        for name, provider in manager.providers.items():
-            config = manager.provider_configs[name]
+        for name, provider in llm_manager.providers.items():
+            config = llm_manager.provider_configs[name]
             print(f"   {name}: enabled={config.enabled}, priority={config.priority}")
         
         # Test provider stats
-        stats = manager.get_provider_stats()
+        stats = llm_manager.get_provider_stats()
         print(f"✅ Provider stats: {list(stats.keys())}")
         
         return True
@@ -197,23 +191,33 @@ def test_llm_manager_integration():
         return False
 
 
+@buffered_output
 def test_cli_config_command():
     """Test CLI config command."""
     print("\n🔍 Testing CLI config command...")
     
     try:
-        import subprocess
-        
-        # Test config command
-        result = subprocess.run([
-            sys.executable, '-m', 'ai_code_audit.cli.main', 'config'
-        ], capture_output=True, text=True, cwd=project_root)
+        if os.environ.get('AI_AUDIT_CLI_E2E'):
+            # End-to-end smoke test in a fresh interpreter
+            import subprocess
+            
+            result = subprocess.run([
+                sys.executable, '-X', 'frozen_modules=on',
+                '-m', 'ai_code_audit.cli.main', 'config'
+            ], env=_CLI_ENV, capture_output=True, text=True, cwd=project_root, timeout=30)
+            exit_code, output, error = result.returncode, result.stdout, result.stderr
+        else:
+            # Run the command in-process, reusing already imported modules
+            from click.testing import CliRunner
+            from ai_code_audit.cli.main import cli
+            
+            result = CliRunner().invoke(cli, ['config'])
+            exit_code, output, error = result.exit_code, result.output, result.output
         
-        if result.returncode == 0:
+        if exit_code == 0:
             print("✅ CLI config command executed successfully")
             
             # Check if output contains expected sections
-            output = result.stdout
             if "Database Configuration" in output:
                 print("✅ Database configuration displayed")
             if "LLM Configuration" in output:
@@ -222,7 +226,7 @@ def test_cli_config_command():
                 print("✅ Audit configuration displayed")
             
         else:
-            print(f"❌ CLI config command failed: {result.stderr}")
+            print(f"❌ CLI config command failed: {error}")
             return False
         
         return True
@@ -237,12 +241,16 @@ def main():
     print("🚀 AI Code Audit System - Configuration System Test")
     print("=" * 60)
     
+    import asyncio
+    
+    manager = LLMManager()
+    
     tests = [
         ("Configuration Loading", test_config_loading),
         ("Environment Override", test_environment_override),
         ("Configuration Validation", test_config_validation),
         ("Config File Discovery", test_config_file_discovery),
-        ("LLM Manager Integration", test_llm_manager_integration),
+        ("LLM Manager Integration", lambda: test_llm_manager_integration(manager)),
         ("CLI Config Command", test_cli_config_command),
     ]
     
@@ -261,6 +269,8 @@ def main():
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
     
+    asyncio.run(manager.close())
+    
     print("\n" + "=" * 60)
     print(f"📊 Configuration System Test Results: {passed}/{total} tests passed")
     
@@ -13,24 +13,26 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from ai_code_audit.core.config import get_config
+from ai_code_audit.llm.base import BaseLLMProvider, LLMModelType
+from ai_code_audit.llm.qwen_provider import QwenProvider
+from ai_code_audit.llm.kimi_provider import KimiProvider
+from tests.output_capture import buffered_output
 
-def test_qwen_context_length():
+# Token estimation inputs, built once at import
+_SMALL = "Hello world"
+_MED = "def hello():\n    print('Hello, world!')\n" * 100
+_LARGE = _MED * 10
+
+
+@buffered_output
+def test_qwen_context_length(qwen_provider):
     """Test Qwen provider context length configuration."""
     print("🔍 Testing Qwen provider context length...")
     
     try:
-        from ai_code_audit.llm.qwen_provider import QwenProvider
-        from ai_code_audit.llm.base import LLMModelType
-        from ai_code_audit.core.config import get_config
-        
-        config = get_config()
-        provider = QwenProvider(
-            api_key=config.llm.qwen.api_key,
-            base_url=config.llm.qwen.base_url
-        )
-        
         # Test context length
-        context_length = provider.get_max_context_length(LLMModelType.QWEN_CODER_30B)
+        context_length = qwen_provider.get_max_context_length(LLMModelType.QWEN_CODER_30B)
         expected_length = 262144  # 256K tokens
         
         print(f"✅ Qwen Coder 30B context length: {context_length:,} tokens")
@@ -47,23 +49,14 @@ def test_qwen_context_length():
         return False
 
 
-def test_kimi_context_length():
+@buffered_output
+def test_kimi_context_length(kimi_provider):
     """Test Kimi provider context length configuration."""
     print("\n🔍 Testing Kimi provider context length...")
     
     try:
-        from ai_code_audit.llm.kimi_provider import KimiProvider
-        from ai_code_audit.llm.base import LLMModelType
-        from ai_code_audit.core.config import get_config
-        
-        config = get_config()
-        provider = KimiProvider(
-            api_key=config.llm.kimi.api_key,
-            base_url=config.llm.kimi.base_url
-        )
-        
         # Test context length
-        context_length = provider.get_max_context_length(LLMModelType.KIMI_K2)
+        context_length = kimi_provider.get_max_context_length(LLMModelType.KIMI_K2)
         expected_length = 128000  # 128K tokens
         
         print(f"✅ Kimi K2 context length: {context_length:,} tokens")
@@ -80,13 +73,12 @@ def test_kimi_context_length():
         return False
 
 
+@buffered_output
 def test_base_class_context_length():
     """Test base class default context lengths."""
     print("\n🔍 Testing base class default context lengths...")
     
     try:
-        from ai_code_audit.llm.base import BaseLLMProvider, LLMModelType
-        
         # Create a dummy provider to test base class
         class TestProvider(BaseLLMProvider):
             def __init__(self):
@@ -139,28 +131,12 @@ def test_base_class_context_length():
         return False
 
 
-def test_context_comparison():
+@buffered_output
+def test_context_comparison(qwen_provider, kimi_provider):
     """Compare context lengths between models."""
     print("\n🔍 Testing context length comparison...")
     
     try:
-        from ai_code_audit.llm.qwen_provider import QwenProvider
-        from ai_code_audit.llm.kimi_provider import KimiProvider
-        from ai_code_audit.llm.base import LLMModelType
-        from ai_code_audit.core.config import get_config
-        
-        config = get_config()
-        
-        qwen_provider = QwenProvider(
-            api_key=config.llm.qwen.api_key,
-            base_url=config.llm.qwen.base_url
-        )
-        
-        kimi_provider = KimiProvider(
-            api_key=config.llm.kimi.api_key,
-            base_url=config.llm.kimi.base_url
-        )
-        
         qwen_length = qwen_provider.get_max_context_length(LLMModelType.QWEN_CODER_30B)
         kimi_length = kimi_provider.get_max_context_length(LLMModelType.KIMI_K2)
         
@@ -181,32 +157,19 @@ def test_context_comparison():
         return False
 
 
-def test_token_estimation():
+@buffered_output
+def test_token_estimation(qwen_provider):
     """Test token estimation with new context lengths."""
     print("\n🔍 Testing token estimation...")
     
     try:
-        from ai_code_audit.llm.qwen_provider import QwenProvider
-        from ai_code_audit.llm.base import LLMModelType
-        from ai_code_audit.core.config import get_config
-        
-        config = get_config()
-        provider = QwenProvider(
-            api_key=config.llm.qwen.api_key,
-            base_url=config.llm.qwen.base_url
-        )
-        
         # Test with different text sizes
-        test_texts = [
-            "Hello world",  # Small
-            "def hello():\n    print('Hello, world!')\n" * 100,  # Medium
-            "def hello():\n    print('Hello, world!')\n" * 1000,  # Large
-        ]
+        test_texts = [_SMALL, _MED, _LARGE]
         
-        context_length = provider.get_max_context_length(LLMModelType.QWEN_CODER_30B)
+        context_length = qwen_provider.get_max_context_length(LLMModelType.QWEN_CODER_30B)
         
         for i, text in enumerate(test_texts):
-            estimated_tokens = provider.estimate_tokens(text)
+            estimated_tokens = qwen_provider.estimate_tokens(text)
             percentage = (estimated_tokens / context_length) * 100
             
             print(f"   Text {i+1}: {estimated_tokens:,} tokens ({percentage:.1f}% of context)")
@@ -231,12 +194,23 @@ def main():
     print("  Previous: 32,768 tokens (32K) ❌")
     print("=" * 50)
     
+    # Providers are shared by all tests
+    config = get_config()
+    qwen_provider = QwenProvider(
+        api_key=config.llm.qwen.api_key,
+        base_url=config.llm.qwen.base_url
+    )
+    kimi_provider = KimiProvider(
+        api_key=config.llm.kimi.api_key,
+        base_url=config.llm.kimi.base_url
+    )
+    
     tests = [
-        ("Qwen Provider Context Length", test_qwen_context_length),
-        ("Kimi Provider Context Length", test_kimi_context_length),
+        ("Qwen Provider Context Length", lambda: test_qwen_context_length(qwen_provider)),
+        ("Kimi Provider Context Length", lambda: test_kimi_context_length(kimi_provider)),
         ("Base Class Context Length", test_base_class_context_length),
-        ("Context Length Comparison", test_context_comparison),
-        ("Token Estimation", test_token_estimation),
+        ("Context Length Comparison", lambda: test_context_comparison(qwen_provider, kimi_provider)),
+        ("Token Estimation", lambda: test_token_estimation(qwen_provider)),
     ]
     
     passed = 0
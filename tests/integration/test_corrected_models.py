@@ -10,49 +10,50 @@ import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from ai_code_audit.core.config import get_config
+from ai_code_audit.llm.base import LLMRequest, LLMMessage, MessageRole, LLMModelType
+from ai_code_audit.llm.manager import LLMManager
+from ai_code_audit.llm.qwen_provider import QwenProvider
+from ai_code_audit.llm.kimi_provider import KimiProvider
+from tests.output_capture import buffered_output
+
+# Prefix used when printing masked API keys
+_MASK = '*' * 20
+
+
+def _mask_key(key):
+    """Return the API key with everything but its last 8 characters masked."""
+    return f"{_MASK}{key[-8:]}" if key else "Not set"
 
-async def test_model_configurations():
+
+# All tests in this module are coroutines on the session loop of the shared fixtures
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@buffered_output
+async def test_model_configurations(qwen_provider, kimi_provider):
     """Test corrected model configurations."""
     print("🔍 Testing corrected model configurations...")
     
     try:
-        from ai_code_audit.llm.base import LLMModelType
-        from ai_code_audit.llm.qwen_provider import QwenProvider
-        from ai_code_audit.llm.kimi_provider import KimiProvider
-        
         print("✅ Model types loaded successfully")
         
         # Test Qwen models
         print("\n📋 Qwen Models:")
-        qwen_models = [
-            LLMModelType.QWEN_TURBO,
-            LLMModelType.QWEN_PLUS,
-            LLMModelType.QWEN_MAX,
-            LLMModelType.QWEN_CODER,
-        ]
-        
-        for model in qwen_models:
+        for model in LLMModelType.qwen_models():
             print(f"  {model.name}: {model.value}")
         
         # Test Kimi models
         print("\n📋 Kimi Models:")
-        kimi_models = [
-            LLMModelType.KIMI_8K,
-            LLMModelType.KIMI_32K,
-            LLMModelType.KIMI_128K,
-        ]
-        
-        for model in kimi_models:
+        for model in LLMModelType.kimi_models():
             print(f"  {model.name}: {model.value}")
         
-        # Test provider initialization
-        qwen_provider = QwenProvider(api_key="test-key")
-        kimi_provider = KimiProvider(api_key="test-key")
-        
         print(f"\n✅ Qwen provider base URL: {qwen_provider.base_url}")
         print(f"✅ Kimi provider base URL: {kimi_provider.base_url}")
         
@@ -70,25 +71,24 @@ async def test_model_configurations():
         return False
 
 
-async def test_configuration_loading():
+@buffered_output
+async def test_configuration_loading(app_config):
     """Test configuration loading with corrected settings."""
     print("\n🔍 Testing configuration loading...")
     
     try:
-        from ai_code_audit.core.config import get_config
-        
-        config = get_config()
+        config = app_config
         
         print("✅ Configuration loaded successfully")
         
         # Test Qwen configuration
         if config.llm.qwen:
-            print(f"✅ Qwen API Key: {'*' * 20 + config.llm.qwen.api_key[-8:]}")
+            print(f"✅ Qwen API Key: {_mask_key(config.llm.qwen.api_key)}")
             print(f"✅ Qwen Base URL: {config.llm.qwen.base_url}")
         
         # Test Kimi configuration
         if config.llm.kimi:
-            print(f"✅ Kimi API Key: {'*' * 20 + config.llm.kimi.api_key[-8:]}")
+            print(f"✅ Kimi API Key: {_mask_key(config.llm.kimi.api_key)}")
             print(f"✅ Kimi Base URL: {config.llm.kimi.base_url}")
         
         # Verify both use SiliconFlow
@@ -105,19 +105,17 @@ async def test_configuration_loading():
         return False
 
 
-async def test_llm_manager():
+@pytest.mark.usefixtures("mock_validate")
+@buffered_output
+async def test_llm_manager(llm_manager):
     """Test LLM manager with corrected configurations."""
     print("\n🔍 Testing LLM manager...")
     
     try:
-        from ai_code_audit.llm.manager import LLMManager
-        
-        manager = LLMManager()
-        
-        print(f"✅ LLM manager initialized with {len(manager.providers)} providers")
+        print(f"✅ LLM manager initialized with {len(llm_manager.providers)} providers")
         
         # Test available models
-        models = manager.get_available_models()
+        models = llm_manager.get_available_models()
         
         for provider_name, provider_models in models.items():
             print(f"\n📋 {provider_name.upper()} Provider Models:")
@@ -125,15 +123,13 @@ async def test_llm_manager():
                 print(f"  {model.name}: {model.value}")
         
         # Test provider validation
-        validation_results = await manager.validate_providers()
+        validation_results = await llm_manager.validate_providers()
         
         print(f"\n🔍 Provider Validation Results:")
         for provider, is_valid in validation_results.items():
             status = "✅ Valid" if is_valid else "❌ Invalid"
             print(f"  {provider}: {status}")
         
-        await manager.close()
-        
         return True
         
     except Exception as e:
@@ -141,18 +137,13 @@ async def test_llm_manager():
         return False
 
 
-async def test_api_request_preparation():
+@buffered_output
+async def test_api_request_preparation(qwen_provider, kimi_provider):
     """Test API request preparation with correct model names."""
     print("\n🔍 Testing API request preparation...")
     
     try:
-        from ai_code_audit.llm.base import LLMRequest, LLMMessage, MessageRole, LLMModelType
-        from ai_code_audit.llm.qwen_provider import QwenProvider
-        from ai_code_audit.llm.kimi_provider import KimiProvider
-        
         # Test Qwen request preparation
-        qwen_provider = QwenProvider(api_key="test-key")
-        
         qwen_request = LLMRequest(
             messages=[LLMMessage(MessageRole.USER, "Hello")],
             model=LLMModelType.QWEN_TURBO
@@ -162,8 +153,6 @@ async def test_api_request_preparation():
         print(f"✅ Qwen API request model: {qwen_api_request['model']}")
         
         # Test Kimi request preparation
-        kimi_provider = KimiProvider(api_key="test-key")
-        
         kimi_request = LLMRequest(
             messages=[LLMMessage(MessageRole.USER, "Hello")],
             model=LLMModelType.KIMI_8K
@@ -195,36 +184,35 @@ async def test_api_request_preparation():
         return False
 
 
+@buffered_output
 async def test_cli_model_options():
     """Test CLI model options."""
     print("\n🔍 Testing CLI model options...")
     
     try:
-        import subprocess
-        
-        # Test audit command help
-        result = subprocess.run([
-            sys.executable, '-m', 'ai_code_audit.cli.main', 'audit', '--help'
-        ], capture_output=True, text=True, cwd=project_root)
-        
-        if result.returncode == 0:
-            print("✅ CLI audit command help works")
-            
-            # Check if new model options are available
-            help_output = result.stdout
-            if 'qwen-coder' in help_output:
-                print("✅ qwen-coder model option available")
-            else:
-                print("❌ qwen-coder model option missing")
-                return False
-            
-            if 'kimi-8k' in help_output:
-                print("✅ kimi model options available")
-            else:
-                print("❌ kimi model options missing")
-                return False
+        from ai_code_audit.cli.main import cli
+        
+        # Read the --model choices straight from the registered click command
+        audit_cmd = cli.commands['audit']
+        model_param = next((p for p in audit_cmd.params if p.name == 'model'), None)
+        
+        if model_param is None:
+            print("❌ CLI audit command has no --model option")
+            return False
+        
+        print("✅ CLI audit command --model option found")
+        
+        model_choices = set(getattr(model_param.type, 'choices', ()))
+        if 'qwen-coder' in model_choices:
+            print("✅ qwen-coder model option available")
         else:
-            print(f"❌ CLI help command failed: {result.stderr}")
+            print("❌ qwen-coder model option missing")
+            return False
+        
+        if 'kimi-8k' in model_choices:
+            print("✅ kimi model options available")
+        else:
+            print("❌ kimi model options missing")
             return False
         
         return True
@@ -239,11 +227,23 @@ async def main():
     print("🚀 AI Code Audit System - Corrected Model Configuration Test")
     print("=" * 70)
     
+    # Manager and providers are shared by all tests
+    config = get_config()
+    manager = LLMManager()
+    qwen_provider = QwenProvider(
+        api_key=config.llm.qwen.api_key,
+        base_url=config.llm.qwen.base_url
+    )
+    kimi_provider = KimiProvider(
+        api_key=config.llm.kimi.api_key,
+        base_url=config.llm.kimi.base_url
+    )
+    
     tests = [
-        ("Model Configurations", test_model_configurations),
-        ("Configuration Loading", test_configuration_loading),
-        ("LLM Manager", test_llm_manager),
-        ("API Request Preparation", test_api_request_preparation),
+        ("Model Configurations", lambda: test_model_configurations(qwen_provider, kimi_provider)),
+        ("Configuration Loading", lambda: test_configuration_loading(config)),
+        ("LLM Manager", lambda: test_llm_manager(manager)),
+        ("API Request Preparation", lambda: test_api_request_preparation(qwen_provider, kimi_provider)),
         ("CLI Model Options", test_cli_model_options),
     ]
     
@@ -262,6 +262,10 @@ async def main():
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {e}")
     
+    await manager.close()
+    await qwen_provider.close()
+    await kimi_provider.close()
+    
     print("\n" + "=" * 70)
     print(f"📊 Corrected Model Test Results: {passed}/{total} tests passed")
     
@@ -10,55 +10,94 @@ This script tests:
 """
 
 import asyncio
+import logging
 import sys
+from collections import Counter
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
+from ai_code_audit.llm.base import LLMModelType
+from tests.output_capture import TaskLocalStdout, run_buffered
+
+# Coverage control components are optional; tests needing a missing one are skipped
+try:
+    from ai_code_audit.analysis.coverage_tracker import CoverageTracker, CodeUnit, CoverageLevel, Priority
+except ImportError:
+    CoverageTracker = CodeUnit = CoverageLevel = Priority = None
+
+try:
+    from ai_code_audit.analysis.task_matrix import TaskMatrix, AnalysisTask, TaskType
+except ImportError:
+    TaskMatrix = AnalysisTask = TaskType = None
+
+try:
+    from ai_code_audit.analysis.coverage_reporter import CoverageReporter
+except ImportError:
+    CoverageReporter = None
+
+try:
+    from ai_code_audit.audit.engine import AuditEngine
+except ImportError:
+    AuditEngine = None
+
+# Test handlers add the full traceback when DEBUG logging is on
+logger = logging.getLogger(__name__)
+
+
+# All tests in this module are coroutines
+pytestmark = pytest.mark.asyncio
 
-async def test_coverage_tracker():
+
+def _require(*components):
+    """Skip the calling test when any of the given components is unavailable."""
+    missing = [component for component in components if globals()[component] is None]
+    if missing:
+        pytest.skip(f"not available: {', '.join(missing)}")
+
+
+async def test_coverage_tracker(coverage_tracker):
     """Test coverage tracking system."""
     print("📊 Testing Coverage Tracking System")
     print("-" * 40)
+    _require('CoverageTracker')
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.coverage_tracker import CoverageTracker, Priority
-        
-        # Analyze current project
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        # Initialize coverage tracker
-        tracker = CoverageTracker(project_info)
+        # Tracker for the current project, owned by this test
+        tracker = coverage_tracker
         
         print(f"1. Discovered code units:")
         print(f"   Total units: {len(tracker.code_units)}")
         print(f"   Files tracked: {len(tracker.file_units)}")
         
         # Show priority distribution
-        priority_counts = {}
-        for unit in tracker.code_units.values():
-            priority_counts[unit.priority.name] = priority_counts.get(unit.priority.name, 0) + 1
+        priority_counts = Counter(unit.priority.name for unit in tracker.code_units.values())
         
         print(f"2. Priority distribution:")
-        for priority, count in priority_counts.items():
-            print(f"   {priority}: {count} units")
+        out = [f"   {priority}: {count} units" for priority, count in priority_counts.items()]
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Test getting next units for analysis
         print(f"3. Getting next units for analysis:")
         next_units = tracker.get_next_units(count=5)
+        out = []
         for unit in next_units:
-            print(f"   - {unit.name} ({unit.unit_type.value}) - Priority: {unit.priority.name}")
-            print(f"     File: {unit.file_path}:{unit.start_line}-{unit.end_line}")
+            out.append(f"   - {unit.name} ({unit.unit_type.value}) - Priority: {unit.priority.name}")
+            out.append(f"     File: {unit.file_path}:{unit.start_line}-{unit.end_line}")
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Simulate some analysis completion
         print(f"4. Simulating analysis completion...")
+        out = []
         for i, unit in enumerate(next_units[:3]):
             tracker.mark_unit_analyzed(unit.id, analysis_duration=30.0 + i * 10)
-            print(f"   Marked {unit.name} as analyzed")
+            out.append(f"   Marked {unit.name} as analyzed")
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Get coverage statistics
         stats = tracker.get_coverage_stats()
@@ -73,8 +112,8 @@ async def test_coverage_tracker():
         
     except Exception as e:
         print(f"❌ Coverage tracking test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Coverage tracking test failed")
         return None
 
 
@@ -82,11 +121,9 @@ async def test_task_matrix():
     """Test task matrix management."""
     print("\n🎯 Testing Task Matrix Management")
     print("-" * 40)
+    _require('TaskMatrix', 'CodeUnit')
     
     try:
-        from ai_code_audit.analysis.task_matrix import TaskMatrix, AnalysisTask, TaskType
-        from ai_code_audit.analysis.coverage_tracker import CodeUnit, CoverageLevel, Priority
-        
         # Initialize task matrix
         matrix = TaskMatrix()
         
@@ -137,11 +174,18 @@ async def test_task_matrix():
         
         # Test task prioritization
         print("2. Testing task prioritization...")
+        previous_score = float('inf')
         for i in range(3):
             next_task = matrix.get_next_task()
             if next_task:
                 print(f"   Next task: {next_task.code_unit.name} (Priority: {next_task.priority.name}, Score: {next_task.priority_score:.3f})")
                 
+                # Tasks must come out in non-increasing priority order
+                if next_task.priority_score > previous_score:
+                    print(f"❌ Task order violated: {next_task.priority_score:.3f} after {previous_score:.3f}")
+                    return None
+                previous_score = next_task.priority_score
+                
                 # Simulate task completion
                 matrix.complete_task(next_task.id, success=True, duration=45.0)
             else:
@@ -151,40 +195,34 @@ async def test_task_matrix():
         # Get queue statistics
         stats = matrix.get_queue_stats()
         print("3. Queue statistics:")
-        for key, value in stats.items():
-            if key != 'last_rebalance':
-                print(f"   {key}: {value}")
+        out = [f"   {key}: {value}" for key, value in stats.items() if key != 'last_rebalance']
+        sys.stdout.write("\n".join(out) + "\n")
         
         # Test priority distribution
         distribution = matrix.get_priority_distribution()
         print("4. Priority distribution:")
-        for priority, count in distribution.items():
-            print(f"   {priority}: {count} tasks")
+        out = [f"   {priority}: {count} tasks" for priority, count in distribution.items()]
+        sys.stdout.write("\n".join(out) + "\n")
         
         print("✅ Task matrix test passed")
         return matrix
         
     except Exception as e:
         print(f"❌ Task matrix test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Task matrix test failed")
         return None
 
 
-async def test_coverage_reporter():
+async def test_coverage_reporter(coverage_tracker):
     """Test coverage reporting system."""
     print("\n📋 Testing Coverage Reporting System")
     print("-" * 40)
+    _require('CoverageTracker', 'CoverageReporter')
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.coverage_tracker import CoverageTracker
-        from ai_code_audit.analysis.coverage_reporter import CoverageReporter
-        
         # Setup coverage tracker with some analyzed units
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        tracker = CoverageTracker(project_info)
+        tracker = coverage_tracker
         
         # Simulate some analysis
         units = tracker.get_next_units(count=5)
@@ -200,16 +238,14 @@ async def test_coverage_reporter():
         
         print("1. Generating coverage reports...")
         
-        # Generate HTML report
-        html_report = reporter.generate_html_report("test_coverage_report.html")
+        # The three formats are independent, so generate them in worker threads
+        html_report, json_data, md_report = await asyncio.gather(
+            asyncio.to_thread(reporter.generate_html_report, "test_coverage_report.html"),
+            asyncio.to_thread(reporter.generate_json_report, "test_coverage_report.json"),
+            asyncio.to_thread(reporter.generate_markdown_report, "test_coverage_report.md"),
+        )
         print(f"   HTML report generated: {len(html_report)} characters")
-        
-        # Generate JSON report
-        json_data = reporter.generate_json_report("test_coverage_report.json")
         print(f"   JSON report generated with {len(json_data)} keys")
-        
-        # Generate Markdown report
-        md_report = reporter.generate_markdown_report("test_coverage_report.md")
         print(f"   Markdown report generated: {len(md_report)} characters")
         
         print("2. Report contents preview:")
@@ -223,8 +259,8 @@ async def test_coverage_reporter():
         
     except Exception as e:
         print(f"❌ Coverage reporting test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Coverage reporting test failed")
         return None
 
 
@@ -232,11 +268,9 @@ async def test_integrated_coverage_control():
     """Test integrated coverage control with audit engine."""
     print("\n🚀 Testing Integrated Coverage Control")
     print("-" * 40)
+    _require('AuditEngine')
     
     try:
-        from ai_code_audit.audit.engine import AuditEngine
-        from ai_code_audit.llm.base import LLMModelType
-        
         # Initialize audit engine with coverage control
         print("1. Initializing audit engine with coverage control...")
         audit_engine = AuditEngine(enable_caching=True)
@@ -298,8 +332,8 @@ async def test_integrated_coverage_control():
         
     except Exception as e:
         print(f"❌ Integrated coverage control test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Integrated coverage control test failed")
         return False
 
 
@@ -308,25 +342,48 @@ async def main():
     print("🧪 Coverage Control Test Suite")
     print("=" * 60)
     
+    # The project is analyzed once, like the project_info fixture under pytest;
+    # each test that mutates a tracker gets its own
+    tracker = reporter_tracker = None
+    if CoverageTracker is not None:
+        try:
+            project_info = await ProjectAnalyzer().analyze_project(".")
+            tracker = CoverageTracker(project_info)
+            reporter_tracker = CoverageTracker(project_info)
+        except Exception as e:
+            print(f"❌ Failed to build coverage trackers: {e}")
+    
     tests = [
-        ("Coverage Tracking System", test_coverage_tracker),
+        ("Coverage Tracking System", lambda: test_coverage_tracker(tracker)),
         ("Task Matrix Management", test_task_matrix),
-        ("Coverage Reporting", test_coverage_reporter),
+        ("Coverage Reporting", lambda: test_coverage_reporter(reporter_tracker)),
         ("Integrated Coverage Control", test_integrated_coverage_control),
     ]
     
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            if result is not None and result is not False:
-                passed += 1
-            else:
-                print(f"❌ {test_name} failed")
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
+    # The tests are independent, so run them concurrently; each task gets its
+    # own output buffer so the reports do not interleave
+    original_stdout = sys.stdout
+    sys.stdout = TaskLocalStdout(original_stdout)
+    try:
+        results = await asyncio.gather(
+            *(run_buffered(test_func) for _, test_func in tests),
+            return_exceptions=True
+        )
+    finally:
+        sys.stdout = original_stdout
+    
+    for (test_name, _), result in zip(tests, results):
+        if isinstance(result, pytest.skip.Exception):
+            print(f"⏭️  {test_name} skipped: {result.msg}")
+        elif isinstance(result, Exception):
+            print(f"❌ {test_name} failed with exception: {result}")
+        elif result is not None and result is not False:
+            passed += 1
+        else:
+            print(f"❌ {test_name} failed")
     
     print("\n" + "=" * 60)
     print(f"📊 Coverage Control Test Results: {passed}/{total} tests passed")
@@ -11,45 +11,179 @@ This script tests:
 """
 
 import asyncio
+import logging
+import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
+from tests.output_capture import TaskLocalStdout, run_buffered
+
+# Tracebacks of failed tests are logged only with DEBUG enabled
+logger = logging.getLogger(__name__)
+
+# All tests in this module are coroutines
+pytestmark = pytest.mark.asyncio
+
+# Report separators and the closing summary printed when every test passes
+_SEP = "-" * 40
+_DSEP = "=" * 60
+_SUCCESS_SUMMARY = """\
+🎉 All minimal sufficient set forensics features are working!
+
+✨ Forensics Capabilities Summary:
+   🧠 Semantic Analysis - Variable dependencies, data/control flow
+   📞 Call Graph - Function relationships and cross-file analysis
+   🔪 Code Slicing - Minimal sufficient set extraction
+   🦠 Taint Analysis - Security vulnerability detection
+   🛤️ Path Validation - Exploitability verification with evidence
+   🔬 Integrated Forensics - Complete security analysis pipeline"""
+
+
+@dataclass
+class ForensicsContext:
+    """Analyzers shared by all forensics tests, built once per run."""
+    project_info: Any
+    semantic_analyzer: Any
+    call_graph_builder: Any
+    taint_analyzer: Any
+    code_slicer: Any
+    path_validator: Any
+    # Whole-project results, filled in by the first test that needs them
+    semantic_results: Any = None
+    call_graph: Any = None
+
+
+def build_forensics_context(project_info):
+    """Construct the complete analyzer pipeline for a project."""
+    from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
+    from ai_code_audit.analysis.call_graph import CallGraphBuilder
+    from ai_code_audit.analysis.taint_analyzer import TaintAnalyzer
+    from ai_code_audit.analysis.code_slicer import CodeSlicer
+    from ai_code_audit.analysis.path_validator import PathValidator
+    
+    semantic_analyzer = SemanticAnalyzer(project_info)
+    call_graph_builder = CallGraphBuilder(project_info)
+    taint_analyzer = TaintAnalyzer(semantic_analyzer, call_graph_builder)
+    code_slicer = CodeSlicer(semantic_analyzer, call_graph_builder)
+    path_validator = PathValidator(semantic_analyzer, call_graph_builder, taint_analyzer, code_slicer)
+    
+    return ForensicsContext(
+        project_info=project_info,
+        semantic_analyzer=semantic_analyzer,
+        call_graph_builder=call_graph_builder,
+        taint_analyzer=taint_analyzer,
+        code_slicer=code_slicer,
+        path_validator=path_validator,
+    )
+
+
+@pytest.fixture(scope="module")
+def ctx(request):
+    """Forensics pipeline shared by the tests in this module."""
+    for module in ('semantic_analyzer', 'call_graph', 'taint_analyzer', 'code_slicer', 'path_validator'):
+        pytest.importorskip(f"ai_code_audit.analysis.{module}")
+    # Requested only after the import checks, so a skip does not analyze the project
+    return build_forensics_context(request.getfixturevalue("project_info"))
+
+
+def _dump_summary(summary):
+    """Serialize a results summary to one JSON line, with orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(summary, ensure_ascii=False)
+    return orjson.dumps(summary).decode()
+
+
+@lru_cache(maxsize=4096)
+def _basename(file_path):
+    """File name of a result path; paths repeat across report lines."""
+    return Path(file_path).name
+
+
+# Keys this file may have in per-file results: absolute, or relative to the
+# project root the tests analyze (the working directory)
+_THIS_FILE = Path(__file__).resolve()
+_THIS_FILE_KEYS = (str(_THIS_FILE), os.path.relpath(_THIS_FILE))
+
+
+def _find_this_file(results):
+    """Return the key of this test file in per-file results, if present."""
+    for key in _THIS_FILE_KEYS:
+        if key in results:
+            return key
+    # Fall back to a scan for analyzers that key files differently
+    return next((file_path for file_path in results if _THIS_FILE.name in file_path), None)
 
-async def test_semantic_analyzer():
+
+async def analyze_semantics(ctx):
+    """Run the semantic pass once per pipeline and reuse its results."""
+    if ctx.semantic_results is None:
+        ctx.semantic_results = await asyncio.to_thread(ctx.semantic_analyzer.analyze_all_files)
+    return ctx.semantic_results
+
+
+async def build_call_graph(ctx):
+    """Build the call graph once per pipeline and reuse it."""
+    if ctx.call_graph is None:
+        ctx.call_graph = await asyncio.to_thread(ctx.call_graph_builder.build_call_graph)
+    return ctx.call_graph
+
+
+def _validate_files(path_validator, files):
+    """Validate files one after another, collecting errors as results.
+
+    The validator and the analyzers behind it are shared and not known to be
+    thread-safe, so files are never validated in parallel.
+    """
+    outcomes = []
+    for file_path in files:
+        try:
+            outcomes.append(path_validator.validate_vulnerability_paths(file_path))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+async def _run_after(test_name, test_func, parents, finished):
+    """Run a buffered test once the tests it builds on have finished."""
+    for parent in parents:
+        await finished[parent].wait()
+    try:
+        return await run_buffered(test_func)
+    finally:
+        finished[test_name].set()
+
+
+async def test_semantic_analyzer(ctx):
     """Test semantic analysis engine."""
     print("🧠 Testing Semantic Analysis Engine")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
-        
-        # Analyze current project
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        # Initialize semantic analyzer
-        semantic_analyzer = SemanticAnalyzer(project_info)
-        
         print("1. Analyzing semantic structure...")
-        results = semantic_analyzer.analyze_all_files()
+        results = await analyze_semantics(ctx)
         
         print(f"   Files analyzed: {len(results)}")
         
         # Show analysis for a specific file
-        test_file = None
-        for file_path in results:
-            if 'test_minimal_sufficient_set.py' in file_path:
-                test_file = file_path
-                break
+        test_file = _find_this_file(results)
         
         if test_file:
             result = results[test_file]
-            print(f"2. Analysis results for {Path(test_file).name}:")
+            print(f"2. Analysis results for {_basename(test_file)}:")
             print(f"   Variables: {len(result.variables)}")
             print(f"   Data flows: {len(result.data_flows)}")
             print(f"   Control flow nodes: {len(result.control_flow_nodes)}")
@@ -59,7 +193,7 @@ async def test_semantic_analyzer():
             
             # Show some variables
             print("3. Sample variables:")
-            for i, (var_id, variable) in enumerate(list(result.variables.items())[:3]):
+            for i, (var_id, variable) in enumerate(islice(result.variables.items(), 3)):
                 print(f"   - {variable.name} ({variable.var_type.value}) at line {variable.defined_at[0]}")
             
             # Show some data flows
@@ -68,33 +202,25 @@ async def test_semantic_analyzer():
                 print(f"   - {flow.source.name} -> {flow.target.name} ({flow.flow_type.value})")
         
         print("✅ Semantic analysis test passed")
-        return semantic_analyzer
+        return True
         
     except Exception as e:
         print(f"❌ Semantic analysis test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Semantic analysis test failed")
+        return False
 
 
-async def test_call_graph_builder():
+async def test_call_graph_builder(ctx):
     """Test call graph construction."""
     print("\n📞 Testing Call Graph Builder")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.call_graph import CallGraphBuilder
-        
-        # Analyze current project
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        # Initialize call graph builder
-        call_graph_builder = CallGraphBuilder(project_info)
+        call_graph_builder = ctx.call_graph_builder
         
         print("1. Building call graph...")
-        call_graph = call_graph_builder.build_call_graph()
+        call_graph = await build_call_graph(ctx)
         
         print(f"   Functions: {len(call_graph.functions)}")
         print(f"   Classes: {len(call_graph.classes)}")
@@ -105,8 +231,8 @@ async def test_call_graph_builder():
         
         # Show some functions
         print("2. Sample functions:")
-        for i, (func_id, function) in enumerate(list(call_graph.functions.items())[:3]):
-            print(f"   - {function.name} in {Path(function.file_path).name}:{function.line_number}")
+        for i, (func_id, function) in enumerate(islice(call_graph.functions.items(), 3)):
+            print(f"   - {function.name} in {_basename(function.file_path)}:{function.line_number}")
             print(f"     Parameters: {function.parameters}")
             print(f"     Complexity: {function.complexity}")
         
@@ -117,41 +243,30 @@ async def test_call_graph_builder():
         
         # Test call chain analysis
         if len(call_graph.functions) >= 2:
-            func_names = list(call_graph.functions.keys())
+            first_func, second_func = islice(call_graph.functions, 2)
             print("4. Testing call chain analysis...")
-            chains = call_graph_builder.get_call_chain(func_names[0], func_names[1])
+            chains = call_graph_builder.get_call_chain(first_func, second_func)
             print(f"   Found {len(chains)} call chains between functions")
         
         print("✅ Call graph construction test passed")
-        return call_graph_builder
+        return True
         
     except Exception as e:
         print(f"❌ Call graph construction test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Call graph construction test failed")
+        return False
 
 
-async def test_code_slicer():
+async def test_code_slicer(ctx):
     """Test code slicing algorithms."""
     print("\n🔪 Testing Code Slicing System")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
-        from ai_code_audit.analysis.call_graph import CallGraphBuilder
-        from ai_code_audit.analysis.code_slicer import CodeSlicer, SlicePoint, SliceCriterion
+        from ai_code_audit.analysis.code_slicer import SlicePoint, SliceCriterion
         
-        # Setup analyzers
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        semantic_analyzer = SemanticAnalyzer(project_info)
-        call_graph_builder = CallGraphBuilder(project_info)
-        
-        # Initialize code slicer
-        code_slicer = CodeSlicer(semantic_analyzer, call_graph_builder)
+        code_slicer = ctx.code_slicer
         
         print("1. Testing backward slicing...")
         
@@ -192,43 +307,33 @@ async def test_code_slicer():
                 print(f"   Line {node.line_number}: {node.content[:50]}...")
         
         print("✅ Code slicing test passed")
-        return code_slicer
+        return True
         
     except Exception as e:
         print(f"❌ Code slicing test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Code slicing test failed")
+        return False
 
 
-async def test_taint_analyzer():
+async def test_taint_analyzer(ctx):
     """Test taint analysis system."""
     print("\n🦠 Testing Taint Analysis System")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
-        from ai_code_audit.analysis.call_graph import CallGraphBuilder
-        from ai_code_audit.analysis.taint_analyzer import TaintAnalyzer
-        
-        # Setup analyzers
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        semantic_analyzer = SemanticAnalyzer(project_info)
-        call_graph_builder = CallGraphBuilder(project_info)
-        
-        # Initialize taint analyzer
-        taint_analyzer = TaintAnalyzer(semantic_analyzer, call_graph_builder)
+        taint_analyzer = ctx.taint_analyzer
         
         print("1. Analyzing taint sources and sinks...")
-        results = taint_analyzer.analyze_all_files()
+        results = await asyncio.to_thread(taint_analyzer.analyze_all_files)
         
-        total_sources = sum(len(result.taint_sources) for result in results.values())
-        total_sinks = sum(len(result.taint_sinks) for result in results.values())
-        total_flows = sum(len(result.taint_flows) for result in results.values())
-        total_vulnerabilities = sum(len(result.vulnerabilities) for result in results.values())
+        # Tally all counters in a single pass over the results
+        total_sources = total_sinks = total_flows = total_vulnerabilities = 0
+        for result in results.values():
+            total_sources += len(result.taint_sources)
+            total_sinks += len(result.taint_sinks)
+            total_flows += len(result.taint_flows)
+            total_vulnerabilities += len(result.vulnerabilities)
         
         print(f"   Taint sources found: {total_sources}")
         print(f"   Taint sinks found: {total_sinks}")
@@ -237,10 +342,10 @@ async def test_taint_analyzer():
         
         # Show analysis for a specific file if available
         if results:
-            sample_file = list(results.keys())[0]
+            sample_file = next(iter(results))
             result = results[sample_file]
             
-            print(f"2. Sample analysis for {Path(sample_file).name}:")
+            print(f"2. Sample analysis for {_basename(sample_file)}:")
             print(f"   Sources: {len(result.taint_sources)}")
             print(f"   Sinks: {len(result.taint_sinks)}")
             print(f"   Tainted variables: {len(result.tainted_variables)}")
@@ -266,54 +371,42 @@ async def test_taint_analyzer():
             print(f"   By type: {summary['by_type']}")
         
         print("✅ Taint analysis test passed")
-        return taint_analyzer
+        return True
         
     except Exception as e:
         print(f"❌ Taint analysis test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Taint analysis test failed")
+        return False
 
 
-async def test_path_validator():
+async def test_path_validator(ctx):
     """Test path validation system."""
     print("\n🛤️ Testing Path Validation System")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
-        from ai_code_audit.analysis.call_graph import CallGraphBuilder
-        from ai_code_audit.analysis.taint_analyzer import TaintAnalyzer
-        from ai_code_audit.analysis.code_slicer import CodeSlicer
-        from ai_code_audit.analysis.path_validator import PathValidator
-        
-        # Setup all analyzers
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        semantic_analyzer = SemanticAnalyzer(project_info)
-        call_graph_builder = CallGraphBuilder(project_info)
-        taint_analyzer = TaintAnalyzer(semantic_analyzer, call_graph_builder)
-        code_slicer = CodeSlicer(semantic_analyzer, call_graph_builder)
-        
-        # Initialize path validator
-        path_validator = PathValidator(semantic_analyzer, call_graph_builder, taint_analyzer, code_slicer)
+        semantic_analyzer = ctx.semantic_analyzer
+        path_validator = ctx.path_validator
         
         print("1. Validating vulnerability paths...")
         
         # Validate paths for files with potential vulnerabilities
+        files = list(islice(semantic_analyzer.file_asts, 3))  # Test first 3 files
+        outcomes = await asyncio.to_thread(_validate_files, path_validator, files)
+        
         validation_results = {}
-        for file_path in list(semantic_analyzer.file_asts.keys())[:3]:  # Test first 3 files
-            try:
-                result = path_validator.validate_vulnerability_paths(file_path)
-                validation_results[file_path] = result
-            except Exception as e:
-                print(f"   Warning: Failed to validate {file_path}: {e}")
+        for file_path, outcome in zip(files, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"   Warning: Failed to validate {file_path}: {outcome}")
+            else:
+                validation_results[file_path] = outcome
         
-        total_paths = sum(r.total_paths_analyzed for r in validation_results.values())
-        exploitable_paths = sum(r.exploitable_paths for r in validation_results.values())
-        potentially_exploitable = sum(r.potentially_exploitable_paths for r in validation_results.values())
+        total_paths = exploitable_paths = potentially_exploitable = 0
+        for r in validation_results.values():
+            total_paths += r.total_paths_analyzed
+            exploitable_paths += r.exploitable_paths
+            potentially_exploitable += r.potentially_exploitable_paths
         
         print(f"   Total paths analyzed: {total_paths}")
         print(f"   Exploitable paths: {exploitable_paths}")
@@ -321,10 +414,10 @@ async def test_path_validator():
         
         # Show detailed results for one file
         if validation_results:
-            sample_file = list(validation_results.keys())[0]
+            sample_file = next(iter(validation_results))
             result = validation_results[sample_file]
             
-            print(f"2. Sample validation for {Path(sample_file).name}:")
+            print(f"2. Sample validation for {_basename(sample_file)}:")
             print(f"   Vulnerability paths: {len(result.vulnerability_paths)}")
             print(f"   Validation coverage: {result.validation_coverage:.1%}")
             print(f"   Analysis confidence: {result.analysis_confidence:.1%}")
@@ -350,71 +443,67 @@ async def test_path_validator():
             print(f"   Average exploitability: {summary['average_exploitability']:.2f}")
         
         print("✅ Path validation test passed")
-        return path_validator
+        return True
         
     except Exception as e:
         print(f"❌ Path validation test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Path validation test failed")
+        return False
 
 
-async def test_integrated_forensics():
+async def test_integrated_forensics(ctx):
     """Test integrated minimal sufficient set forensics."""
     print("\n🔬 Testing Integrated Forensics System")
-    print("-" * 40)
+    print(_SEP)
     
     try:
-        from ai_code_audit.analysis.project_analyzer import ProjectAnalyzer
-        from ai_code_audit.analysis.semantic_analyzer import SemanticAnalyzer
-        from ai_code_audit.analysis.call_graph import CallGraphBuilder
-        from ai_code_audit.analysis.taint_analyzer import TaintAnalyzer
-        from ai_code_audit.analysis.code_slicer import CodeSlicer, SlicePoint
-        from ai_code_audit.analysis.path_validator import PathValidator
-        
         print("1. Setting up integrated forensics pipeline...")
         
-        # Setup complete analysis pipeline
-        analyzer = ProjectAnalyzer()
-        project_info = await analyzer.analyze_project(".")
-        
-        semantic_analyzer = SemanticAnalyzer(project_info)
-        call_graph_builder = CallGraphBuilder(project_info)
-        taint_analyzer = TaintAnalyzer(semantic_analyzer, call_graph_builder)
-        code_slicer = CodeSlicer(semantic_analyzer, call_graph_builder)
-        path_validator = PathValidator(semantic_analyzer, call_graph_builder, taint_analyzer, code_slicer)
+        # The complete analysis pipeline is shared with the component tests
+        taint_analyzer = ctx.taint_analyzer
+        path_validator = ctx.path_validator
         
         print("2. Running complete forensics analysis...")
         
-        # Run semantic analysis
-        semantic_results = semantic_analyzer.analyze_all_files()
-        
-        # Build call graph
-        call_graph = call_graph_builder.build_call_graph()
+        # Run semantic analysis and build the call graph; both are independent
+        # inputs to taint analysis, so they run concurrently
+        semantic_results, call_graph = await asyncio.gather(
+            analyze_semantics(ctx),
+            build_call_graph(ctx),
+        )
         
         # Run taint analysis
-        taint_results = taint_analyzer.analyze_all_files()
+        taint_results = await asyncio.to_thread(taint_analyzer.analyze_all_files)
         
-        # Validate paths for files with vulnerabilities
-        files_with_vulns = [f for f, r in taint_results.items() if r.vulnerabilities]
+        # Validate paths for files with vulnerabilities, limited to the first 2
+        files_with_vulns = []
+        total_vulnerabilities = 0
+        for file_path, result in taint_results.items():
+            if result.vulnerabilities:
+                if len(files_with_vulns) < 2:
+                    files_with_vulns.append(file_path)
+                total_vulnerabilities += len(result.vulnerabilities)
         
         validation_results = {}
-        for file_path in files_with_vulns[:2]:  # Limit to first 2 files
+        for file_path in files_with_vulns:
             validation_results[file_path] = path_validator.validate_vulnerability_paths(file_path)
         
+        # Count validated paths and their evidence in one pass
+        validated_paths = total_evidence = 0
+        for result in validation_results.values():
+            validated_paths += len(result.vulnerability_paths)
+            for vuln_path in result.vulnerability_paths:
+                total_evidence += len(vuln_path.evidence_chain)
+        
         print("3. Forensics analysis complete!")
         print(f"   Files analyzed: {len(semantic_results)}")
         print(f"   Functions in call graph: {len(call_graph.functions)}")
-        print(f"   Total vulnerabilities: {sum(len(r.vulnerabilities) for r in taint_results.values())}")
-        print(f"   Validated vulnerability paths: {sum(len(r.vulnerability_paths) for r in validation_results.values())}")
+        print(f"   Total vulnerabilities: {total_vulnerabilities}")
+        print(f"   Validated vulnerability paths: {validated_paths}")
         
         # Generate comprehensive evidence
         print("4. Evidence generation:")
-        total_evidence = 0
-        for result in validation_results.values():
-            for vuln_path in result.vulnerability_paths:
-                total_evidence += len(vuln_path.evidence_chain)
-        
         print(f"   Total evidence items: {total_evidence}")
         
         # Show integration benefits
@@ -430,50 +519,104 @@ async def test_integrated_forensics():
         
     except Exception as e:
         print(f"❌ Integrated forensics test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Integrated forensics test failed")
         return False
 
 
-async def main():
-    """Run all minimal sufficient set forensics tests."""
+async def main(only=None, json_summary=False):
+    """Run the minimal sufficient set forensics tests.
+    
+    Args:
+        only: Optional comma-separated fragments of test names; when given,
+            only the matching tests run
+        json_summary: Also print the outcome of every test as a single JSON
+            object line for CI consumption
+    """
     print("🔬 Minimal Sufficient Set Forensics Test Suite")
-    print("=" * 60)
+    print(_DSEP)
     
     tests = [
-        ("Semantic Analysis Engine", test_semantic_analyzer),
-        ("Call Graph Builder", test_call_graph_builder),
-        ("Code Slicing System", test_code_slicer),
-        ("Taint Analysis System", test_taint_analyzer),
-        ("Path Validation System", test_path_validator),
-        ("Integrated Forensics", test_integrated_forensics),
+        ("Semantic Analysis Engine", lambda: test_semantic_analyzer(forensics_ctx)),
+        ("Call Graph Builder", lambda: test_call_graph_builder(forensics_ctx)),
+        ("Code Slicing System", lambda: test_code_slicer(forensics_ctx)),
+        ("Taint Analysis System", lambda: test_taint_analyzer(forensics_ctx)),
+        ("Path Validation System", lambda: test_path_validator(forensics_ctx)),
+        ("Integrated Forensics", lambda: test_integrated_forensics(forensics_ctx)),
     ]
     
+    # Tests each one builds on: later stages reuse the analysis results the
+    # earlier ones leave in the shared pipeline. Slicing and taint analysis
+    # both drive the shared semantic analyzer and call graph builder, which
+    # are not known to be thread-safe, so they run one after the other.
+    depends_on = {
+        "Code Slicing System": ("Semantic Analysis Engine", "Call Graph Builder"),
+        "Taint Analysis System": ("Semantic Analysis Engine", "Call Graph Builder",
+                                  "Code Slicing System"),
+        "Path Validation System": ("Semantic Analysis Engine", "Call Graph Builder",
+                                   "Taint Analysis System", "Code Slicing System"),
+        "Integrated Forensics": ("Semantic Analysis Engine", "Call Graph Builder",
+                                 "Taint Analysis System", "Code Slicing System",
+                                 "Path Validation System"),
+    }
+    
+    if only:
+        fragments = [fragment.strip().lower() for fragment in only.split(',') if fragment.strip()]
+        tests = [(test_name, test_func) for test_name, test_func in tests
+                 if any(fragment in test_name.lower() for fragment in fragments)]
+        if not tests:
+            print(f"❌ No tests match --only {only}")
+            return 1
+    
+    # The project is analyzed once and the analyzer pipeline is shared by all tests
+    project_info = await ProjectAnalyzer().analyze_project(".")
+    try:
+        forensics_ctx = build_forensics_context(project_info)
+    except Exception as e:
+        print(f"❌ Failed to set up forensics pipeline: {e}")
+        forensics_ctx = None
+    
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            if result is not None and result is not False:
-                passed += 1
-            else:
-                print(f"❌ {test_name} failed")
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
+    # Every test starts as soon as the tests it depends on have finished; only
+    # the semantic and call graph tests, which use separate analyzers, overlap.
+    # Each task gets its own output buffer so the reports do not interleave,
+    # and each report is written with a single call once the test finishes.
+    finished = {test_name: asyncio.Event() for test_name, _ in tests}
+    original_stdout = sys.stdout
+    sys.stdout = TaskLocalStdout(original_stdout)
+    try:
+        results = await asyncio.gather(
+            *(_run_after(test_name, test_func,
+                         [parent for parent in depends_on.get(test_name, ()) if parent in finished],
+                         finished)
+              for test_name, test_func in tests),
+            return_exceptions=True
+        )
+    finally:
+        sys.stdout = original_stdout
+    
+    outcomes = {}
+    for (test_name, _), result in zip(tests, results):
+        if isinstance(result, Exception):
+            print(f"❌ {test_name} failed with exception: {result}")
+            outcomes[test_name] = "error"
+        elif result:
+            passed += 1
+            outcomes[test_name] = "passed"
+        else:
+            print(f"❌ {test_name} failed")
+            outcomes[test_name] = "failed"
     
-    print("\n" + "=" * 60)
+    print("\n" + _DSEP)
     print(f"🔬 Forensics Test Results: {passed}/{total} tests passed")
     
+    if json_summary:
+        print(_dump_summary({"suite": "forensics", "passed": passed, "total": total, "tests": outcomes}))
+    
     if passed == total:
-        print("🎉 All minimal sufficient set forensics features are working!")
-        print("\n✨ Forensics Capabilities Summary:")
-        print("   🧠 Semantic Analysis - Variable dependencies, data/control flow")
-        print("   📞 Call Graph - Function relationships and cross-file analysis")
-        print("   🔪 Code Slicing - Minimal sufficient set extraction")
-        print("   🦠 Taint Analysis - Security vulnerability detection")
-        print("   🛤️ Path Validation - Exploitability verification with evidence")
-        print("   🔬 Integrated Forensics - Complete security analysis pipeline")
+        print(_SUCCESS_SUMMARY)
         return 0
     else:
         print("⚠️  Some forensics features need attention.")
@@ -481,4 +624,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit(asyncio.run(main()))
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Minimal sufficient set forensics tests")
+    parser.add_argument("--only", help="comma-separated test name fragments to run, e.g. semantic,taint")
+    parser.add_argument("--json", action="store_true", help="also print a one-line JSON summary of the results")
+    args = parser.parse_args()
+    
+    exit(asyncio.run(main(args.only, args.json)))
@@ -10,6 +10,7 @@ This script tests:
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -17,6 +18,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Failing tests log their traceback only at DEBUG level
+logger = logging.getLogger(__name__)
+
 
 async def test_hallucination_detector():
     """Test hallucination detection system."""
@@ -107,8 +111,8 @@ The class definition starts at line -5 which is invalid.'''
         
     except Exception as e:
         print(f"❌ Hallucination detection test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Hallucination detection test failed")
         return None
 
 
@@ -189,8 +193,8 @@ def encrypt_password(password):
         
     except Exception as e:
         print(f"❌ Consistency checking test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Consistency checking test failed")
         return None
 
 
@@ -243,8 +247,8 @@ async def test_duplicate_detector():
         
     except Exception as e:
         print(f"❌ Duplicate detection test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Duplicate detection test failed")
         return None
 
 
@@ -308,8 +312,8 @@ async def test_failure_handler():
         
     except Exception as e:
         print(f"❌ Failure handling test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Failure handling test failed")
         return None
 
 
@@ -361,8 +365,8 @@ async def test_integrated_validation():
         
     except Exception as e:
         print(f"❌ Integrated validation test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Integrated validation test failed")
         return False
 
 
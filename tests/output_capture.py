@@ -0,0 +1,69 @@
+"""
+Output helpers shared by the test scripts.
+
+Tests print progress reports. When tests run side by side, each test's output
+is collected and written in one piece so that reports do not interleave.
+"""
+
+import contextvars
+import functools
+import inspect
+import io
+import sys
+from contextlib import redirect_stdout
+
+
+# Output buffer of the currently running test task (None outside of run_buffered)
+_task_output = contextvars.ContextVar('_task_output', default=None)
+
+
+class TaskLocalStdout:
+    """stdout proxy that routes writes to the running task's own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = _task_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def run_buffered(test_func):
+    """Run a test with its output collected and written in one piece.
+
+    Meant to run as its own task while ``sys.stdout`` is a ``TaskLocalStdout``.
+    """
+    buffer = io.StringIO()
+    _task_output.set(buffer)
+    try:
+        return await test_func()
+    finally:
+        _task_output.set(None)
+        sys.stdout.write(buffer.getvalue())
+
+
+def buffered_output(func):
+    """Buffer a test's console output and write it with a single call."""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            buffer = io.StringIO()
+            try:
+                with redirect_stdout(buffer):
+                    return await func(*args, **kwargs)
+            finally:
+                sys.stdout.write(buffer.getvalue())
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    return wrapper
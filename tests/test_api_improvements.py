@@ -3,8 +3,12 @@
 测试API改进效果的脚本
 """
 import asyncio
+import dataclasses
 import time
 import logging
+
+import pytest
+
 from ai_code_audit.llm.manager import LLMManager
 from ai_code_audit.llm.models import LLMRequest, LLMMessage, MessageRole, LLMModelType
 
@@ -15,28 +19,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 本模块的测试均为协程，与会话级的LLM管理器运行在同一事件循环上
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# 限流统计中没有历史数据时使用的单请求Token估算
+_DEFAULT_REQUEST_TOKENS = 1000
+
+
+def _wave_size(rate_stats, remaining):
+    """根据当前TPM/RPM余量计算下一批可并发的请求数"""
+    avg_tokens = (rate_stats.get('avg_actual_tokens')
+                  or rate_stats.get('current_token_estimate')
+                  or _DEFAULT_REQUEST_TOKENS)
+    tpm_left = rate_stats.get('max_tpm', 0) - rate_stats.get('current_tpm', 0)
+    k = int(tpm_left / avg_tokens)
+    rpm_left = rate_stats.get('available_requests')
+    if rpm_left is not None:
+        k = min(k, int(rpm_left))
+    return max(1, min(k, max(1, remaining)))
+
+
+def _percentile(values, percent):
+    """最近秩法计算百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
 
-async def test_api_improvements():
+
+async def test_api_improvements(llm_manager):
     """测试API改进效果"""
     print("🧪 测试API改进效果")
     print("=" * 50)
     
-    # 初始化LLM管理器
-    llm_manager = LLMManager()
-    
-    # 创建测试请求
-    test_requests = []
-    for i in range(20):  # 创建20个请求来测试TPM限制优化
-        request = LLMRequest(
+    # 创建测试请求：系统消息和请求参数只构建一次，每个请求只替换用户消息
+    system_msg = LLMMessage(MessageRole.SYSTEM, "你是一个代码安全审计专家")
+    proto = LLMRequest(
+        messages=[system_msg],
+        model=LLMModelType.KIMI_K2,
+        temperature=0.1,
+        max_tokens=100
+    )
+    test_requests = [  # 创建20个请求来测试TPM限制优化
+        dataclasses.replace(
+            proto,
             messages=[
-                LLMMessage(MessageRole.SYSTEM, "你是一个代码安全审计专家"),
+                system_msg,
                 LLMMessage(MessageRole.USER, f"请分析这段代码的安全性 #{i+1}: console.log('test');")
             ],
-            model=LLMModelType.KIMI_K2,
-            temperature=0.1,
-            max_tokens=100
+            metadata={}
         )
-        test_requests.append(request)
+        for i in range(20)
+    ]
     
     print(f"📊 初始统计:")
     stats = llm_manager.get_comprehensive_stats()
@@ -44,28 +79,45 @@ async def test_api_improvements():
     print(f"  TPM使用率: {stats['rate_limits']['tpm_usage_percent']:.1f}%")
     print(f"  RPM使用率: {stats['rate_limits']['rpm_usage_percent']:.1f}%")
     
-    # 并发执行请求
-    start_time = time.time()
-    
-    async def execute_request(req, index):
-        try:
-            logger.info(f"开始执行请求 #{index+1}")
-            response = await llm_manager.chat_completion(req)
-            logger.info(f"请求 #{index+1} 完成，响应长度: {len(response.content)}")
-            return True, None
-        except Exception as e:
-            logger.error(f"请求 #{index+1} 失败: {e}")
-            return False, str(e)
-    
-    # 执行所有请求
-    tasks = [execute_request(req, i) for i, req in enumerate(test_requests)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # 按TPM/RPM余量分批执行请求，每批通过batch_chat_completion一次提交
+    results = [(False, "未执行")] * len(test_requests)  # 按请求序号预分配 (是否成功, 错误信息)
+    successful = 0
+    durations = []
+    k = _wave_size(stats['rate_limits'], len(test_requests))
+    start_time = time.perf_counter()
+    
+    next_index = 0
+    wave = 0
+    while next_index < len(test_requests):
+        wave += 1
+        batch = test_requests[next_index:next_index + k]
+        print(f"  第{wave}批: {len(batch)} 个请求")
+        
+        wave_start = time.perf_counter()
+        responses = await llm_manager.batch_chat_completion(batch)
+        wave_time = time.perf_counter() - wave_start
+        
+        for offset, response in enumerate(responses):
+            index = next_index + offset
+            if isinstance(response, Exception):
+                logger.error(f"请求 #{index+1} 失败: {response}")
+                results[index] = (False, str(response))
+                durations.append(wave_time)
+            else:
+                logger.info(f"请求 #{index+1} 完成，响应长度: {len(response.content)}")
+                results[index] = (True, None)
+                successful += 1
+                # 优先使用提供商记录的单请求耗时
+                durations.append(response.response_time or wave_time)
+        next_index += len(batch)
+        
+        # 每批结束后根据最新限流统计重新计算批大小
+        rate_stats = llm_manager.get_comprehensive_stats()['rate_limits']
+        k = _wave_size(rate_stats, len(test_requests) - next_index)
     
-    end_time = time.time()
-    total_time = end_time - start_time
+    total_time = time.perf_counter() - start_time
     
     # 统计结果
-    successful = sum(1 for r in results if isinstance(r, tuple) and r[0])
     failed = len(results) - successful
     
     print(f"\n📊 测试结果:")
@@ -75,6 +127,8 @@ async def test_api_improvements():
     print(f"  成功率: {successful/len(test_requests)*100:.1f}%")
     print(f"  总耗时: {total_time:.2f}秒")
     print(f"  平均耗时: {total_time/len(test_requests):.2f}秒/请求")
+    print(f"  P50耗时: {_percentile(durations, 50):.2f}秒")
+    print(f"  P95耗时: {_percentile(durations, 95):.2f}秒")
     
     # 详细统计
     final_stats = llm_manager.get_comprehensive_stats()
@@ -97,21 +151,18 @@ async def test_api_improvements():
     # 失败详情
     if failed > 0:
         print(f"\n❌ 失败详情:")
-        for i, result in enumerate(results):
-            if isinstance(result, tuple) and not result[0]:
-                print(f"  请求 #{i+1}: {result[1]}")
-            elif isinstance(result, Exception):
-                print(f"  请求 #{i+1}: {result}")
-    
-    await llm_manager.close()
+        for i, (ok, error) in enumerate(results):
+            if not ok:
+                print(f"  请求 #{i+1}: {error}")
 
 
-async def test_error_recovery():
+async def test_error_recovery(llm_manager):
     """测试错误恢复机制"""
     print("\n🔄 测试错误恢复机制")
     print("=" * 50)
     
-    llm_manager = LLMManager()
+    # 共享的管理器可能已被前面的测试触发熔断，先恢复初始状态
+    llm_manager.reset_circuit_breaker()
     
     # 创建一个可能导致错误的请求（超长内容）
     long_content = "分析这段代码: " + "x" * 10000  # 超长内容可能导致错误
@@ -133,16 +184,15 @@ async def test_error_recovery():
     except Exception as e:
         print(f"❌ 请求失败: {e}")
         print("🔧 检查重试机制是否正常工作...")
-    
-    await llm_manager.close()
 
 
-async def test_circuit_breaker():
+async def test_circuit_breaker(llm_manager):
     """测试熔断器机制"""
     print("\n⚡ 测试熔断器机制")
     print("=" * 50)
     
-    llm_manager = LLMManager()
+    # 共享的管理器可能已被前面的测试触发熔断，先恢复初始状态
+    llm_manager.reset_circuit_breaker()
     
     # 创建多个可能失败的请求来触发熔断器
     invalid_requests = []
@@ -176,14 +226,17 @@ async def test_circuit_breaker():
             break
         
         await asyncio.sleep(1)  # 间隔1秒
-    
-    await llm_manager.close()
 
 
 if __name__ == "__main__":
     async def main():
-        await test_api_improvements()
-        await test_error_recovery()
-        await test_circuit_breaker()
+        # 三个测试共享同一个LLM管理器
+        llm_manager = LLMManager()
+        try:
+            await test_api_improvements(llm_manager)
+            await test_error_recovery(llm_manager)
+            await test_circuit_breaker(llm_manager)
+        finally:
+            await llm_manager.close()
     
     asyncio.run(main())
@@ -55,9 +55,10 @@ async def test_cross_file_analysis():
         return False
     
     try:
-        # 读取测试文件
-        with open(test_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            code = f.read()
+        # 读取测试文件（在线程中读取，不阻塞事件循环）
+        code = await asyncio.to_thread(
+            Path(test_file_path).read_text, encoding='utf-8', errors='ignore'
+        )
         
         print(f"📄 测试文件: {Path(test_file_path).name}")
         print(f"📄 文件大小: {len(code)} 字符")
@@ -163,8 +164,9 @@ async def test_related_file_detection():
         return False
     
     try:
-        with open(test_file, 'r', encoding='utf-8', errors='ignore') as f:
-            code = f.read()
+        code = await asyncio.to_thread(
+            Path(test_file).read_text, encoding='utf-8', errors='ignore'
+        )
         
         # 模拟一个文件上传漏洞
         finding = {
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from ai_code_audit.llm.manager import LLMManager
 from ai_code_audit.llm.models import LLMRequest, LLMMessage, MessageRole, LLMModelType
+from ai_code_audit.llm.rate_limiter import RateLimitConfig, TokenBucket
 
 # 配置日志
 logging.basicConfig(
@@ -22,6 +23,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _make_bucket(capacity, available):
+    """按每分钟配额创建Token桶，初始余量取当前可用量"""
+    bucket = TokenBucket(capacity=capacity, refill_rate=capacity / 60.0)
+    bucket.tokens = min(capacity, available)
+    return bucket
+
+
+async def _take(bucket, amount):
+    """从Token桶中扣减配额，不足时等待补充而不是触发限流重试"""
+    while not await bucket.consume(amount):
+        await asyncio.sleep(bucket.get_wait_time(amount))
+
+
 async def test_file_filtering():
     """测试文件过滤逻辑"""
     print("🔍 测试文件过滤逻辑")
@@ -83,15 +97,34 @@ async def test_api_optimizations():
         llm_manager = LLMManager()
         
         # 显示初始统计
+        limits = RateLimitConfig()
+        max_concurrency = 5
+        rate_stats = {}
         if hasattr(llm_manager, 'get_comprehensive_stats'):
             stats = llm_manager.get_comprehensive_stats()
+            max_concurrency = stats['concurrency']['current_concurrency']
+            rate_stats = stats['rate_limits']
             print(f"📊 初始统计:")
-            print(f"  并发数: {stats['concurrency']['current_concurrency']}")
-            print(f"  TPM使用率: {stats['rate_limits'].get('tpm_usage_percent', 0):.1f}%")
-            print(f"  RPM使用率: {stats['rate_limits'].get('rpm_usage_percent', 0):.1f}%")
+            print(f"  并发数: {max_concurrency}")
+            print(f"  TPM使用率: {rate_stats.get('tpm_usage_percent', 0):.1f}%")
+            print(f"  RPM使用率: {rate_stats.get('rpm_usage_percent', 0):.1f}%")
         else:
             print("📊 使用基础统计")
         
+        # 按当前TPM/RPM余量预先扣减配额，避免触发429后的退避重试
+        semaphore = asyncio.Semaphore(max_concurrency)
+        max_tpm = rate_stats.get('max_tpm', limits.tpm)
+        max_rpm = rate_stats.get('max_rpm', limits.rpm)
+        tpm_bucket = _make_bucket(max_tpm, rate_stats.get('available_tokens', max_tpm))
+        rpm_bucket = _make_bucket(max_rpm, rate_stats.get('available_requests', max_rpm))
+        
+        async def guarded(request):
+            estimated_tokens = sum(len(msg.content) for msg in request.messages) // 4
+            async with semaphore:
+                await _take(rpm_bucket, 1)
+                await _take(tpm_bucket, estimated_tokens)
+                return await llm_manager.chat_completion(request)
+        
         # 创建测试请求
         test_requests = []
         for i in range(5):  # 减少到5个请求以快速测试
@@ -106,20 +139,26 @@ async def test_api_optimizations():
             )
             test_requests.append(request)
         
-        # 执行请求
+        # 按模型和消息前缀排序，相同系统提示的请求相邻发送以命中提供商的前缀缓存
+        test_requests = LLMManager.sort_by_prefix(test_requests)
+        prefix_groups = len({(r.model.value, r.messages[0].content) for r in test_requests})
+        
+        # 并发执行请求，网络等待相互重叠
         start_time = time.time()
         successful = 0
         failed = 0
         
-        for i, request in enumerate(test_requests):
-            try:
-                logger.info(f"执行请求 #{i+1}")
-                response = await llm_manager.chat_completion(request)
+        responses = await asyncio.gather(
+            *(guarded(request) for request in test_requests),
+            return_exceptions=True
+        )
+        for i, response in enumerate(responses):
+            if isinstance(response, Exception):
+                logger.error(f"请求 #{i+1} 失败: {response}")
+                failed += 1
+            else:
                 logger.info(f"请求 #{i+1} 成功，响应长度: {len(response.content)}")
                 successful += 1
-            except Exception as e:
-                logger.error(f"请求 #{i+1} 失败: {e}")
-                failed += 1
         
         end_time = time.time()
         total_time = end_time - start_time
@@ -131,6 +170,8 @@ async def test_api_optimizations():
         print(f"  成功率: {successful/len(test_requests)*100:.1f}%")
         print(f"  总耗时: {total_time:.2f}秒")
         print(f"  平均耗时: {total_time/len(test_requests):.2f}秒/请求")
+        print(f"  前缀分组: {prefix_groups} 组")
+        print(f"  预期前缀缓存命中: {len(test_requests) - prefix_groups} 个请求")
         
         await llm_manager.close()
         
@@ -151,20 +151,19 @@ async def test_frontend_optimization():
     optimizer = FrontendOptimizer()
     total_time_saved = 0
     
+    # 一次批量分析所有测试文件
+    start_time = time.time()
+    results = optimizer.analyze_batch([(tc['file_path'], tc['content']) for tc in test_cases])
+    analysis_time = time.time() - start_time
+    
     print("📊 前端优化测试结果:")
     print("=" * 80)
+    print(f"批量分析时间: {analysis_time:.3f}秒 ({len(test_cases)} 个文件)")
     
-    for i, test_case in enumerate(test_cases, 1):
+    for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
         print(f"\n🔍 测试 {i}: {test_case['name']}")
         print(f"文件: {test_case['file_path']}")
         print(f"内容长度: {len(test_case['content'])} 字符")
-        
-        # 分析前端文件
-        start_time = time.time()
-        result = optimizer.analyze_frontend_file(test_case['file_path'], test_case['content'])
-        analysis_time = time.time() - start_time
-        
-        print(f"分析时间: {analysis_time:.3f}秒")
         print(f"应该跳过: {result.should_skip}")
         
         if result.should_skip:
@@ -7,6 +7,7 @@
 
 import sys
 import json
+import types
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -16,7 +17,73 @@ sys.path.insert(0, str(Path(__file__).parent))
 from ai_code_audit.analysis.context_analyzer import ContextAnalyzer
 from ai_code_audit.analysis.confidence_calculator import ConfidenceCalculator
 from ai_code_audit.config.security_config import get_security_config
+from tests.output_capture import buffered_output
 
+# 置信度计算器测试用例 (只读，模块加载时构建一次)
+_CONFIDENCE_CASES = (
+    (
+        "测试用例1 - JPA查询",
+        types.MappingProxyType({
+            'type': 'SQL注入',
+            'severity': 'high',
+            'description': 'JPA查询中的潜在SQL注入',
+            'code_snippet': '@Query("from Plan p where p.label like %?1%") Page<Plan> findBybasekey(String baseKey, long userid, Pageable pa);'
+        }),
+        types.MappingProxyType({
+            'frameworks': types.MappingProxyType({'spring_data_jpa': True, 'mybatis': False}),
+            'architecture_layer': 'dao',
+            'file_path': 'PlanDao.java'
+        }),
+    ),
+    (
+        "测试用例2 - MyBatis危险参数",
+        types.MappingProxyType({
+            'type': 'SQL注入',
+            'severity': 'high',
+            'description': 'MyBatis中的SQL注入',
+            'code_snippet': 'WHERE name = \'${name}\''
+        }),
+        types.MappingProxyType({
+            'frameworks': types.MappingProxyType({'mybatis': True, 'spring_data_jpa': False}),
+            'architecture_layer': 'dao',
+            'file_path': 'UserMapper.xml'
+        }),
+    ),
+    (
+        "测试用例3 - DAO层权限验证",
+        types.MappingProxyType({
+            'type': '权限验证绕过',
+            'severity': 'high',
+            'description': 'DAO层缺少权限验证',
+            'code_snippet': 'public List<Plan> findByUser(User user) { return planDao.findByUser(user); }'
+        }),
+        types.MappingProxyType({
+            'frameworks': types.MappingProxyType({'spring_data_jpa': True}),
+            'architecture_layer': 'dao',
+            'file_path': 'PlanDao.java'
+        }),
+    ),
+)
+
+# 模拟LLM返回的原始发现 (只读模板，修改前需复制)
+_RAW_FINDINGS = tuple(types.MappingProxyType(d) for d in [
+    {
+        'type': 'SQL注入',
+        'severity': 'high',
+        'description': 'JPA查询中的潜在SQL注入风险',
+        'code_snippet': '@Query("from Plan p where p.label like %?1%") Page<Plan> findBybasekey(String baseKey, long userid, Pageable pa);',
+        'line': 49
+    },
+    {
+        'type': '权限验证绕过',
+        'severity': 'high', 
+        'description': 'DAO层缺少权限验证',
+        'code_snippet': 'return planDao.findBybasekey(baseKey, userid, pa);',
+        'line': 36
+    }
+])
+
+@buffered_output
 def test_context_analyzer():
     """测试上下文分析器"""
     print("🔍 测试上下文分析器...")
@@ -61,72 +128,21 @@ def test_context_analyzer():
         print(f"❌ 上下文分析器测试失败: {e}")
         return False
 
+@buffered_output
 def test_confidence_calculator():
     """测试置信度计算器"""
     print("\n🎯 测试置信度计算器...")
     
     calculator = ConfidenceCalculator()
     
-    # 测试用例1: Spring Data JPA的SQL注入误报
-    test_finding_1 = {
-        'type': 'SQL注入',
-        'severity': 'high',
-        'description': 'JPA查询中的潜在SQL注入',
-        'code_snippet': '@Query("from Plan p where p.label like %?1%") Page<Plan> findBybasekey(String baseKey, long userid, Pageable pa);'
-    }
-    
-    test_context_1 = {
-        'frameworks': {'spring_data_jpa': True, 'mybatis': False},
-        'architecture_layer': 'dao',
-        'file_path': 'PlanDao.java'
-    }
-    
     try:
-        result_1 = calculator.calculate_confidence(test_finding_1, test_context_1)
-        print(f"✅ 测试用例1 - JPA查询:")
-        print(f"  置信度: {result_1.final_score:.2f}")
-        print(f"  风险等级: {result_1.risk_level}")
-        print(f"  主要原因: {result_1.reasoning[0] if result_1.reasoning else '无'}")
-        
-        # 测试用例2: MyBatis危险参数
-        test_finding_2 = {
-            'type': 'SQL注入',
-            'severity': 'high',
-            'description': 'MyBatis中的SQL注入',
-            'code_snippet': 'WHERE name = \'${name}\''
-        }
-        
-        test_context_2 = {
-            'frameworks': {'mybatis': True, 'spring_data_jpa': False},
-            'architecture_layer': 'dao',
-            'file_path': 'UserMapper.xml'
-        }
-        
-        result_2 = calculator.calculate_confidence(test_finding_2, test_context_2)
-        print(f"\n✅ 测试用例2 - MyBatis危险参数:")
-        print(f"  置信度: {result_2.final_score:.2f}")
-        print(f"  风险等级: {result_2.risk_level}")
-        print(f"  主要原因: {result_2.reasoning[0] if result_2.reasoning else '无'}")
-        
-        # 测试用例3: DAO层权限验证误报
-        test_finding_3 = {
-            'type': '权限验证绕过',
-            'severity': 'high',
-            'description': 'DAO层缺少权限验证',
-            'code_snippet': 'public List<Plan> findByUser(User user) { return planDao.findByUser(user); }'
-        }
-        
-        test_context_3 = {
-            'frameworks': {'spring_data_jpa': True},
-            'architecture_layer': 'dao',
-            'file_path': 'PlanDao.java'
-        }
-        
-        result_3 = calculator.calculate_confidence(test_finding_3, test_context_3)
-        print(f"\n✅ 测试用例3 - DAO层权限验证:")
-        print(f"  置信度: {result_3.final_score:.2f}")
-        print(f"  风险等级: {result_3.risk_level}")
-        print(f"  主要原因: {result_3.reasoning[0] if result_3.reasoning else '无'}")
+        for index, (case_name, test_finding, test_context) in enumerate(_CONFIDENCE_CASES):
+            result = calculator.calculate_confidence(test_finding, test_context)
+            prefix = "\n" if index else ""
+            print(f"{prefix}✅ {case_name}:")
+            print(f"  置信度: {result.final_score:.2f}")
+            print(f"  风险等级: {result.risk_level}")
+            print(f"  主要原因: {result.reasoning[0] if result.reasoning else '无'}")
         
         return True
         
@@ -134,6 +150,7 @@ def test_confidence_calculator():
         print(f"❌ 置信度计算器测试失败: {e}")
         return False
 
+@buffered_output
 def test_security_config():
     """测试安全配置系统"""
     print("\n⚙️ 测试安全配置系统...")
@@ -167,6 +184,7 @@ def test_security_config():
         print(f"❌ 安全配置系统测试失败: {e}")
         return False
 
+@buffered_output
 def test_integration():
     """测试集成效果"""
     print("\n🔗 测试集成效果...")
@@ -176,23 +194,7 @@ def test_integration():
         config = get_security_config()
         calculator = ConfidenceCalculator()
         
-        # 模拟LLM返回的原始发现
-        raw_findings = [
-            {
-                'type': 'SQL注入',
-                'severity': 'high',
-                'description': 'JPA查询中的潜在SQL注入风险',
-                'code_snippet': '@Query("from Plan p where p.label like %?1%") Page<Plan> findBybasekey(String baseKey, long userid, Pageable pa);',
-                'line': 49
-            },
-            {
-                'type': '权限验证绕过',
-                'severity': 'high', 
-                'description': 'DAO层缺少权限验证',
-                'code_snippet': 'return planDao.findBybasekey(baseKey, userid, pa);',
-                'line': 36
-            }
-        ]
+        raw_findings = _RAW_FINDINGS
         
         file_path = "examples/test_oa-system/src/main/java/cn/gson/oasys/model/dao/plandao/PlanDao.java"
         code = """
@@ -220,14 +222,14 @@ def test_integration():
             filtered_findings.append(finding)
         
         # 3. 置信度评估
+        context = types.MappingProxyType({
+            'frameworks': frameworks,
+            'architecture_layer': 'dao',
+            'file_path': file_path
+        })
         enhanced_findings = []
-        for finding in filtered_findings:
-            context = {
-                'frameworks': frameworks,
-                'architecture_layer': 'dao',
-                'file_path': file_path
-            }
-            
+        for template in filtered_findings:
+            finding = dict(template)
             confidence_result = calculator.calculate_confidence(finding, context)
             finding['confidence'] = confidence_result.final_score
             finding['risk_level'] = confidence_result.risk_level
@@ -282,12 +284,13 @@ def main():
     print("📋 测试总结")
     print('='*50)
     
-    passed = sum(1 for _, result in results if result)
+    passed = 0
     total = len(results)
     
     for test_name, result in results:
         status = "✅ 通过" if result else "❌ 失败"
         print(f"  {test_name}: {status}")
+        passed += bool(result)
     
     print(f"\n🎯 总体结果: {passed}/{total} 测试通过")
     
@@ -298,5 +301,5 @@ def main():
         print("⚠️ 部分测试失败，需要进一步调试")
         return 1
 
-if __name__ == "__main__":
-    exit(main())
+if __name__ == "__main__" and "pytest" not in sys.modules:
+    sys.exit(main())
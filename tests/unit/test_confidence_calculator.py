@@ -0,0 +1,46 @@
+"""
+Unit tests for the confidence calculator.
+
+This module tests that confidence results survive copying and pickling.
+"""
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from ai_code_audit.analysis.confidence_calculator import ConfidenceFactors, ConfidenceResult
+
+
+class TestConfidenceResult:
+    """Test ConfidenceResult."""
+    
+    @pytest.fixture
+    def result(self):
+        """Fixture providing a confidence result."""
+        return ConfidenceResult(
+            final_score=0.42,
+            factors=ConfidenceFactors(framework_protection=0.5),
+            reasoning=["framework protection detected"],
+            risk_level="medium",
+        )
+    
+    def test_result_is_frozen(self, result):
+        """Test that fields cannot be reassigned."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.final_score = 1.0
+    
+    @pytest.mark.parametrize("round_trip", [
+        copy.copy,
+        copy.deepcopy,
+        lambda value: pickle.loads(pickle.dumps(value)),
+    ], ids=["copy", "deepcopy", "pickle"])
+    def test_result_round_trip(self, result, round_trip):
+        """Test that a result can be copied and pickled."""
+        restored = round_trip(result)
+        
+        assert restored == result
+        assert restored is not result
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            restored.risk_level = "low"
@@ -311,6 +311,74 @@ class TestLLMManager:
         assert stats['qwen']['provider_type'] == 'qwen'
         assert stats['qwen']['enabled'] == True
         assert stats['qwen']['request_count'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_llm_manager_analyze_code_reuses_cached_response(self):
+        """Test that identical analyze_code calls hit the LLM only once."""
+        config = {
+            'llm': {
+                'qwen': {
+                    'api_key': 'test-qwen-key',
+                    'enabled': True
+                }
+            }
+        }
+        
+        manager = LLMManager(config)
+        response = LLMResponse(content="[]", model="test-model")
+        
+        with patch.object(manager, 'chat_completion', AsyncMock(return_value=response)) as mock_chat:
+            for _ in range(2):
+                result = await manager.analyze_code(
+                    "print('hello')", "app.py", "python",
+                    analysis_context="related_file"
+                )
+                assert result['success'] is True
+            
+            await manager.analyze_code(
+                "print('other')", "app.py", "python",
+                analysis_context="related_file"
+            )
+        
+        assert mock_chat.await_count == 2
+        assert len(manager.response_cache) == 2
+    
+    @pytest.mark.asyncio
+    async def test_llm_manager_batch_chat_completion(self):
+        """Test batch completion keeps request order and returns failures."""
+        manager = LLMManager({'llm': {}})
+        requests = [
+            LLMRequest(messages=[LLMMessage(MessageRole.USER, text)], model=LLMModelType.QWEN_CODER_30B)
+            for text in ("first", "fail", "third")
+        ]
+        
+        async def fake_completion(request, preferred_provider=None, fallback=True):
+            content = request.messages[0].content
+            if content == "fail":
+                raise LLMError("boom")
+            return LLMResponse(content=content, model="test-model")
+        
+        with patch.object(manager, 'chat_completion', side_effect=fake_completion):
+            results = await manager.batch_chat_completion(requests)
+        
+        assert results[0].content == "first"
+        assert isinstance(results[1], LLMError)
+        assert results[2].content == "third"
+    
+    def test_llm_manager_sort_by_prefix(self):
+        """Test requests sharing a system prompt are grouped together."""
+        def make(system, user):
+            return LLMRequest(
+                messages=[LLMMessage(MessageRole.SYSTEM, system), LLMMessage(MessageRole.USER, user)],
+                model=LLMModelType.QWEN_CODER_30B
+            )
+        
+        requests = [make("b", "1"), make("a", "2"), make("b", "0"), make("a", "1")]
+        ordered = LLMManager.sort_by_prefix(requests)
+        
+        assert [r.messages[0].content for r in ordered] == ["a", "a", "b", "b"]
+        assert [r.messages[1].content for r in ordered] == ["1", "2", "0", "1"]
+        assert requests[0].messages[0].content == "b"
 
 
 class TestPromptManager: